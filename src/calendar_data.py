@@ -27,6 +27,7 @@ class DayEvents:
     date: date
     events: list
     is_today: bool
+    overflow_count: int = 0  # Events dropped by limit_events_per_day
 
 
 class CalendarDataProcessor:
@@ -197,10 +198,9 @@ class CalendarDataProcessor:
                 limited_events[day] = DayEvents(
                     date=day_events.date,
                     events=day_events.events[:max_events],
-                    is_today=day_events.is_today
+                    is_today=day_events.is_today,
+                    overflow_count=len(day_events.events) - max_events
                 )
-                # Store overflow count for display
-                limited_events[day].overflow_count = len(day_events.events) - max_events
             else:
                 limited_events[day] = day_events
                 limited_events[day].overflow_count = 0
@@ -16,6 +16,30 @@ class EPaperDisplay:
     EPD_GREEN = 0x00FF00
     EPD_BLUE = 0x0000FF
 
+    # Palette matching official Waveshare driver
+    # Palette order: Black, White, Yellow, Red, Black(duplicate), Blue, Green
+    PANEL_PALETTE = (
+        (0, 0, 0,           # 0: Black
+         255, 255, 255,     # 1: White
+         255, 255, 0,       # 2: Yellow
+         255, 0, 0,         # 3: Red
+         0, 0, 0,           # 4: Black (duplicate)
+         0, 0, 255,         # 5: Blue
+         0, 255, 0)         # 6: Green
+        + (0, 0, 0) * 249   # Fill remaining palette slots
+    )
+
+    # Panel palette index of each native color (official Waveshare order:
+    # Black, White, Yellow, Red, Black(duplicate), Blue, Green)
+    PANEL_INDEX = {
+        (0, 0, 0): 0,
+        (255, 255, 255): 1,
+        (255, 255, 0): 2,
+        (255, 0, 0): 3,
+        (0, 0, 255): 5,
+        (0, 255, 0): 6,
+    }
+
     def __init__(self, config):
         """
         Initialize e-paper display.
@@ -41,10 +65,15 @@ class EPaperDisplay:
         }
 
     def init_display(self):
-        """Initialize the e-paper display hardware."""
+        """
+        Initialize the e-paper display hardware.
+
+        Returns:
+            bool: False if the hardware failed and the driver fell back to mock mode
+        """
         if self.mock_mode:
             self.logger.info("Running in mock mode - no hardware initialization")
-            return
+            return True
 
         # Import Waveshare library only when needed (not in mock mode)
         try:
@@ -62,14 +91,17 @@ class EPaperDisplay:
             self.epd = epd7in3e.EPD()
             self.epd.init()
             self.logger.info("Display initialized successfully")
+            return True
         except ImportError as e:
             self.logger.error(f"Failed to import Waveshare library: {e}")
             self.logger.warning("Falling back to mock mode")
             self.mock_mode = True
+            return False
         except Exception as e:
             self.logger.error(f"Failed to initialize display: {e}")
             self.logger.warning("Falling back to mock mode")
             self.mock_mode = True
+            return False
 
     def quantize_image(self, image):
         """
@@ -86,25 +118,20 @@ class EPaperDisplay:
             PIL.Image: Quantized palette image
         """
         from PIL import ImageChops
-        
+
+        pal_image = self._palette_image()
+
+        # Palette canvas drawn only in native colors: remap indices directly
+        lut = self._panel_index_lut(image)
+        if lut is not None:
+            quantized_result = image.point(lut)
+            quantized_result.putpalette(pal_image.getpalette())
+            return quantized_result
+
         # Convert to RGB if needed
         if image.mode != 'RGB':
             image = image.convert('RGB')
 
-        # Create palette image matching official Waveshare driver
-        # Palette order: Black, White, Yellow, Red, Black(duplicate), Blue, Green
-        pal_image = Image.new("P", (1, 1))
-        pal_image.putpalette(
-            (0, 0, 0,           # 0: Black
-             255, 255, 255,     # 1: White
-             255, 255, 0,       # 2: Yellow
-             255, 0, 0,         # 3: Red
-             0, 0, 0,           # 4: Black (duplicate)
-             0, 0, 255,         # 5: Blue
-             0, 255, 0)         # 6: Green
-            + (0, 0, 0) * 249   # Fill remaining palette slots
-        )
-
         # Quantize to the 7-color palette with Floyd-Steinberg dithering
         # This creates visual approximations of intermediate colors (purple, orange, etc.)
         # by distributing pixels of the available colors
@@ -145,6 +172,43 @@ class EPaperDisplay:
         
         return quantized_result
 
+    _pal_image = None  # Shared 1x1 palette image used as the quantize target
+
+    @classmethod
+    def _palette_image(cls):
+        """Return the shared palette image for quantizing to panel colors."""
+        if cls._pal_image is None:
+            pal_image = Image.new("P", (1, 1))
+            pal_image.putpalette(cls.PANEL_PALETTE)
+            cls._pal_image = pal_image
+        return cls._pal_image
+
+    def _panel_index_lut(self, image):
+        """
+        Build a lookup table from a palette canvas to panel color indices.
+
+        A 'P' canvas that only uses the native panel colors needs no dithering,
+        so its palette indices can be remapped straight to the panel's.
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            list: 256-entry index lookup table, or None if the image is not a
+            palette image or uses a color the panel can't show natively
+        """
+        if image.mode != 'P':
+            return None
+        palette = image.getpalette()
+        lut = [0] * 256
+        for _, index in image.getcolors(256):
+            rgb = tuple(palette[index * 3:index * 3 + 3])
+            panel_index = self.PANEL_INDEX.get(rgb)
+            if panel_index is None:
+                return None
+            lut[index] = panel_index
+        return lut
+
     def _find_nearest_color(self, rgb):
         """
         Find the nearest e-paper color for an RGB value.
@@ -176,6 +240,9 @@ class EPaperDisplay:
 
         Args:
             image: PIL Image object
+
+        Returns:
+            bool: True if the image was shown (or saved, in mock mode)
         """
         # Ensure image is correct size
         if image.size != (self.display_config['width'], self.display_config['height']):
@@ -193,23 +260,39 @@ class EPaperDisplay:
             output_path = 'calendar_display.png'
             quantized_image.convert('RGB').save(output_path)
             self.logger.info(f"Mock mode: Saved image to {output_path}")
+            return True
         else:
             try:
                 self.logger.info("Sending image to e-paper display...")
 
-                # Use the Waveshare library's getbuffer() method
-                # It handles quantization and byte packing correctly for the hardware
-                buffer = self.epd.getbuffer(image)
+                if image.size == (self.epd.width, self.epd.height):
+                    lut = self._panel_index_lut(image)
+                    if lut is not None:
+                        # Palette canvas in native colors: remap to panel indices
+                        # without an RGB round trip
+                        indexed = image.point(lut)
+                    else:
+                        # Same quantization as the Waveshare getbuffer()
+                        indexed = image.convert('RGB').quantize(palette=self._palette_image())
+                    # One packed bytes buffer for a single SPI write, instead of
+                    # getbuffer()'s per-pixel Python packing loop and int list
+                    buffer = self._image_to_buffer(indexed)
+                else:
+                    # Use the Waveshare library's getbuffer() method, which also
+                    # handles rotating portrait images for the hardware
+                    buffer = self.epd.getbuffer(image)
 
                 # Display on e-paper
                 self.epd.display(buffer)
                 self.logger.info("Image displayed successfully")
+                return True
 
             except Exception as e:
                 self.logger.error(f"Failed to display image: {e}")
                 # Save as backup for debugging
                 image.save('calendar_display_error.png')
                 self.logger.info("Saved error backup to calendar_display_error.png")
+                return False
 
     def _image_to_buffer(self, image):
         """
@@ -222,21 +305,9 @@ class EPaperDisplay:
         Returns:
             bytearray: Buffer for Waveshare display
         """
-        # The 7.3" HAT (E) uses 4 bits per pixel (2 pixels per byte)
-        # Get the palette indices directly
-        buf_indices = bytearray(image.tobytes('raw'))
-
-        # Pack 2 pixels (4-bit color indices) into each byte
-        width, height = image.size
-        buf = [0x00] * (width * height // 2)
-
-        idx = 0
-        for i in range(0, len(buf_indices), 2):
-            # Pack high nibble (first pixel) and low nibble (second pixel)
-            buf[idx] = (buf_indices[i] << 4) + buf_indices[i + 1]
-            idx += 1
-
-        return bytes(buf)
+        # The 7.3" HAT (E) uses 4 bits per pixel (2 pixels per byte), first
+        # pixel in the high nibble, which is exactly Pillow's 'P;4' raw packer
+        return image.tobytes('raw', 'P;4')
 
     def clear(self):
         """Clear the display (set to white)."""
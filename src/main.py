@@ -1,5 +1,7 @@
 """Main entry point for HA-Calendar e-ink display."""
 
+import copy
+import hashlib
 import sys
 import os
 import time
@@ -18,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.logger import setup_logger, get_logger
 from utils.color_manager import ColorManager
-from utils.state_manager import save_state
+from utils.state_manager import clear_inputs_hash, load_state, save_state
 from ha_client import HomeAssistantClient
 from calendar_data import CalendarDataProcessor
 from weather_data import WeatherDataProcessor
@@ -29,18 +31,38 @@ RETRY_INTERVAL = 300    # seconds between retries when HA is unreachable
 REFRESH_INTERVAL = 3600  # seconds between normal display updates
 
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Last parsed config, with the (mtime_ns, size, inode) of the file it came from
+_config_cache = {'signature': None, 'config': None}
+
+
 def load_config():
+    """
+    Load config.yaml, reparsing only when the file changes.
+
+    The display loop and every webhook refresh call this, so an unchanged file
+    is served from the cache. Callers get their own deep copy.
+    """
     config_path = Path(__file__).parent.parent / 'config' / 'config.yaml'
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         print(f"ERROR: Configuration file not found: {config_path}")
         print("Please copy config/config.example.yaml to config/config.yaml and configure it.")
         sys.exit(1)
-    try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except Exception as e:
-        print(f"ERROR: Failed to load configuration: {e}")
-        sys.exit(1)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    if signature != _config_cache['signature']:
+        try:
+            with open(config_path, 'r') as f:
+                config = yaml.load(f, Loader=YAML_LOADER)
+        except Exception as e:
+            print(f"ERROR: Failed to load configuration: {e}")
+            sys.exit(1)
+        _config_cache['signature'] = signature
+        _config_cache['config'] = config
+    return copy.deepcopy(_config_cache['config'])
 
 
 def select_renderer(view_name, config, color_manager):
@@ -113,8 +135,29 @@ def _render_offline_screen(config):
     return image
 
 
-def main():
-    """Run one display update cycle. Returns False if HA was unreachable."""
+def _render_inputs_hash(config, current_view, today, events_by_day, weather_info,
+                        footer_sensor_text, weather_summary):
+    """
+    Hash everything a render depends on, so unchanged data can skip the redraw.
+
+    Returns:
+        str: Hex digest, or None for views that also depend on the time of day
+    """
+    if current_view == 'agenda':
+        return None  # Hides today's events once they have started
+    inputs = (config, current_view, today, events_by_day, weather_info,
+              footer_sensor_text, weather_summary)
+    return hashlib.sha256(repr(inputs).encode()).hexdigest()
+
+
+def main(skip_unchanged=False):
+    """
+    Run one display update cycle. Returns False if HA was unreachable.
+
+    Args:
+        skip_unchanged: Leave the display alone when the fetched data matches
+            the last render (the footer's "Last Updated" time is not refreshed)
+    """
     start_time = datetime.now()
     config = load_config()
     logger = setup_logger(config)
@@ -136,6 +179,7 @@ def main():
             display.init_display()
             display.display_image(_render_offline_screen(config))
             display.sleep()
+            clear_inputs_hash()
             logger.info("=" * 60)
             return False
 
@@ -240,16 +284,30 @@ def main():
         else:
             events_by_day = calendar_processor.get_events_for_range(parsed_events, days_ahead=14)
 
+        inputs_hash = _render_inputs_hash(
+            config, current_view, today, events_by_day, weather_info,
+            footer_sensor_text, weather_summary
+        )
+        if skip_unchanged and inputs_hash and inputs_hash == (load_state() or {}).get('inputs_hash'):
+            logger.info("Calendar data unchanged since the last render; display left as is")
+            logger.info("=" * 60)
+            return True
+
         logger.info(f"Rendering {current_view} view...")
         renderer = select_renderer(current_view, config, color_manager)
         image = renderer.render(events_by_day, weather_info, footer_sensor_text, weather_summary=weather_summary)
 
         logger.info("Updating display...")
-        display.init_display()
-        display.display_image(image)
+        panel_ready = display.init_display()
+        displayed = display.display_image(image)
         display.sleep()
 
-        save_state(last_updated=datetime.now().isoformat(), current_view=current_view)
+        if panel_ready and displayed:
+            save_state(last_updated=datetime.now().isoformat(), current_view=current_view, inputs_hash=inputs_hash)
+        else:
+            # The panel was not written, so the next refresh must not be skipped
+            logger.warning("Display update failed; the next refresh will redraw")
+            clear_inputs_hash()
 
         elapsed = (datetime.now() - start_time).total_seconds()
         logger.info(f"Update completed in {elapsed:.2f}s")
@@ -275,6 +333,7 @@ def main():
             display.init_display()
             display.display_image(err_img)
             display.sleep()
+            clear_inputs_hash()
         except Exception:
             pass
         return None  # Let __main__ decide the exit code; don't kill the retry loop
@@ -31,7 +31,7 @@ class AgendaRenderer(BaseRenderer):
         Returns:
             PIL.Image: Rendered calendar image
         """
-        image, draw = self.create_canvas()
+        image, draw = self.create_canvas(reuse=True)
 
         y = 0
 
@@ -125,7 +125,7 @@ class AgendaRenderer(BaseRenderer):
                     if event.all_day:
                         event_text = f"{event.title} (All Day)"
                     else:
-                        time_str = event.start.strftime("%I:%M %p")
+                        time_str = self.format_time(event.start)
                         event_text = f"{time_str} - {event.title}"
                     
                     text_lines = self.wrap_text(
@@ -161,7 +161,7 @@ class AgendaRenderer(BaseRenderer):
             )
 
             # Draw underline for date
-            date_bbox = draw.textbbox((padding, content_y), date_str, font=self.fonts['large'])
+            date_bbox = self._text_bbox(draw, date_str, self.fonts['large'])
             date_width = date_bbox[2] - date_bbox[0]
             draw.line(
                 [(padding, content_y + 24), (padding + date_width, content_y + 24)],
@@ -216,7 +216,7 @@ class AgendaRenderer(BaseRenderer):
                 if event.all_day:
                     event_text = f"{event.title} (All Day)"
                 else:
-                    time_str = event.start.strftime("%I:%M %p")
+                    time_str = self.format_time(event.start)
                     event_text = f"{time_str} - {event.title}"
 
                 # Draw wrapped event text
@@ -264,19 +264,16 @@ class AgendaRenderer(BaseRenderer):
         weather_y = weather_top
 
         if weather_info:
-            from weather_data import WeatherDataProcessor
-            weather_processor = WeatherDataProcessor()
-
-            icon, icon_color = weather_processor.get_weather_icon_with_color(weather_info.condition.lower())
+            icon, icon_color = self.weather_processor.get_weather_icon_with_color(weather_info.condition.lower())
             temp_str = f"{weather_info.temperature:.0f}{weather_info.temperature_unit}"
 
             icon_font = self.fonts.get('weather_large', self.fonts['xlarge'])
             temp_font = self.fonts['xlarge']
 
-            icon_bbox = draw.textbbox((0, 0), icon, font=icon_font) if icon else (0, 0, 0, 0)
+            icon_bbox = self._text_bbox(draw, icon, icon_font) if icon else (0, 0, 0, 0)
             icon_width = icon_bbox[2] - icon_bbox[0]
             icon_height = icon_bbox[3] - icon_bbox[1]
-            temp_bbox = draw.textbbox((0, 0), temp_str, font=temp_font)
+            temp_bbox = self._text_bbox(draw, temp_str, temp_font)
             temp_width = temp_bbox[2] - temp_bbox[0]
 
             gap = 10 if icon else 0
@@ -316,8 +313,8 @@ class AgendaRenderer(BaseRenderer):
                 date_key = today.isoformat()
                 today_forecast = weather_info.forecast.get(date_key)
                 if today_forecast:
-                    high_str = f"{int(today_forecast.temperature)}°"
-                    low_str = f"{int(today_forecast.temperature_low)}°" if today_forecast.temperature_low is not None else ""
+                    high_str = self.format_temp(today_forecast.temperature)
+                    low_str = self.format_temp(today_forecast.temperature_low) if today_forecast.temperature_low is not None else ""
                     
                     if high_str and low_str:
                         # Set up icons and fonts (smaller to fit on one line)
@@ -340,16 +337,16 @@ class AgendaRenderer(BaseRenderer):
                         wind_speed_text = f"{weather_info.wind_speed:.0f} {weather_info.wind_speed_unit}{wind_suffix}"
                         
                         # Measure all components
-                        wind_icon_bbox = draw.textbbox((0, 0), wind_icon, font=wind_icon_font_small)
+                        wind_icon_bbox = self._text_bbox(draw, wind_icon, wind_icon_font_small)
                         wind_icon_width = wind_icon_bbox[2] - wind_icon_bbox[0]
-                        wind_speed_bbox = draw.textbbox((0, 0), wind_speed_text, font=temp_font)
+                        wind_speed_bbox = self._text_bbox(draw, wind_speed_text, temp_font)
                         wind_speed_width = wind_speed_bbox[2] - wind_speed_bbox[0]
                         
-                        thermo_bbox = draw.textbbox((0, 0), thermo_icon, font=weather_icon_font)
+                        thermo_bbox = self._text_bbox(draw, thermo_icon, weather_icon_font)
                         thermo_width = thermo_bbox[2] - thermo_bbox[0]
-                        temp_bbox = draw.textbbox((0, 0), temp_text, font=temp_font)
+                        temp_bbox = self._text_bbox(draw, temp_text, temp_font)
                         temp_width = temp_bbox[2] - temp_bbox[0]
-                        humidity_icon_bbox = draw.textbbox((0, 0), humidity_icon, font=weather_icon_font)
+                        humidity_icon_bbox = self._text_bbox(draw, humidity_icon, weather_icon_font)
                         humidity_icon_width = humidity_icon_bbox[2] - humidity_icon_bbox[0]
                         
                         # Layout: wind (left) + gap + thermo+temp+humidity (right)
@@ -418,8 +415,6 @@ class AgendaRenderer(BaseRenderer):
         forecast_item_width = right_width // 4
         if weather_info and weather_info.forecast:
             today = date.today()
-            from weather_data import WeatherDataProcessor
-            weather_processor = WeatherDataProcessor()
             weather_icon_font = self.fonts.get('weather_medium', self.fonts['large'])
 
             for day_offset in range(1, 5):  # Skip today (day 0), show days 1-4
@@ -429,9 +424,9 @@ class AgendaRenderer(BaseRenderer):
                 if not forecast:
                     continue
 
-                icon, icon_color = weather_processor.get_weather_icon_with_color(forecast.condition.lower())
-                high_str = f"{int(forecast.temperature)}°"
-                low_str = f"{int(forecast.temperature_low)}°" if forecast.temperature_low is not None else ""
+                icon, icon_color = self.weather_processor.get_weather_icon_with_color(forecast.condition.lower())
+                high_str = self.format_temp(forecast.temperature)
+                low_str = self.format_temp(forecast.temperature_low) if forecast.temperature_low is not None else ""
                 temp_str = f"{high_str}/{low_str}" if low_str else high_str
                 day_label = forecast_date.strftime("%a")
 
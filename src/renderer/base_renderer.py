@@ -1,14 +1,135 @@
 """Base renderer class with shared rendering utilities."""
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImagePalette
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, time
+from functools import lru_cache
 from utils.logger import get_logger
+from weather_data import WeatherDataProcessor
+
+
+@lru_cache(maxsize=32)
+def _load_font(path, size):
+    """
+    Load a TrueType font (cached per path and size).
+
+    Every renderer asks for the same handful of faces, so the FreeType parse
+    happens once per process and the shared font objects also keep the
+    _text_bbox cache warm across renderers.
+    """
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=8)
+def _first_existing(paths):
+    """Return the first path in a tuple that exists on disk, or None."""
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=8)
+def _format_long_date(day):
+    """Format a date as e.g. 'Wednesday, September 10, 2025' (cached per day)."""
+    return day.strftime("%A, %B %d, %Y")
+
+
+@lru_cache(maxsize=256)
+def _format_degrees(value):
+    """Format an integer temperature with a degree sign (cached per value)."""
+    # Escaped so the sign survives editors or tools that mangle non-ASCII source
+    return f"{value}\u00B0"
+
+
+@lru_cache(maxsize=256)
+def _format_clock(hour, minute, fmt):
+    """Format a time of day (cached per hour, minute and format)."""
+    return time(hour, minute).strftime(fmt)
+
+
+@lru_cache(maxsize=4096)
+def _text_bbox(font, text, fontmode):
+    """
+    Bounding box of text drawn at the origin (cached per font, text and mode).
+
+    Same result as ImageDraw.textbbox((0, 0), ...) on a canvas with the given
+    font mode; '1' (palette canvases) hints glyphs differently from 'L'.
+    The font object itself is part of the key, so a cached entry keeps its
+    font alive and can never be confused with a later font.
+    """
+    return font.getbbox(text, mode=fontmode)
+
+
+@lru_cache(maxsize=64)
+def _text_sprite(font, text, fontmode):
+    """
+    Rasterize a string once into an 'L' coverage mask (cached).
+
+    Args:
+        font: Font object
+        text: Text to rasterize
+        fontmode: ImageDraw font mode of the target ('L' or '1')
+
+    Returns:
+        tuple: (mask Image, left, top) where left/top offset the mask from
+        the text origin
+    """
+    left, top, right, bottom = _text_bbox(font, text, fontmode)
+    sprite = Image.new('L', (max(1, right - left), max(1, bottom - top)), 0)
+    sprite_draw = ImageDraw.Draw(sprite)
+    sprite_draw.fontmode = fontmode
+    sprite_draw.text((-left, -top), text, font=font, fill=255)
+    return sprite, left, top
+
+
+@lru_cache(maxsize=64)
+def _avg_char_width(font):
+    """Average advance width of a lowercase letter or space for a font."""
+    sample = 'abcdefghijklmnopqrstuvwxyz '
+    return max(1.0, font.getlength(sample) / len(sample))
+
+
+def _pack_lanes(starts, ends, max_lanes):
+    """
+    Assign start-sorted column spans to the first lane that is free.
+
+    Pure integer loop so it stays independent of dates and events.
+
+    Args:
+        starts: Start column of each span, sorted ascending
+        ends: Inclusive end column of each span
+        max_lanes: Maximum number of lanes to open
+
+    Returns:
+        List with the lane index of each span, or -1 if it overflowed
+    """
+    busy_until = []
+    assigned = []
+    for start, end in zip(starts, ends):
+        for lane_idx, busy in enumerate(busy_until):
+            if start > busy:
+                busy_until[lane_idx] = end
+                assigned.append(lane_idx)
+                break
+        else:
+            if len(busy_until) < max_lanes:
+                assigned.append(len(busy_until))
+                busy_until.append(end)
+            else:
+                assigned.append(-1)
+    return assigned
 
 
 class BaseRenderer:
     """Base class for calendar renderers with common utilities."""
 
+    LEGEND_MAX_ITEMS = 3  # Calendars shown in the footer legend
+
+    # One reusable full-screen canvas per mode and display size:
+    # {(mode, w, h): (Image, ImageDraw)}
+    _canvas_pool = {}
+
     def __init__(self, config, color_manager):
         """
         Initialize base renderer.
@@ -26,6 +147,12 @@ class BaseRenderer:
         self.width = display_config['width']
         self.height = display_config['height']
 
+        # Canvas pixel mode: 'RGB' (default) or 'P' (1 byte per pixel palette)
+        self.canvas_mode = display_config.get('canvas_mode', 'RGB')
+        if self.canvas_mode not in ('RGB', 'P'):
+            self.logger.warning(f"Unsupported canvas_mode '{self.canvas_mode}', using RGB")
+            self.canvas_mode = 'RGB'
+
         # Colors
         self.black = self.color_manager.get_rgb('black')
         self.white = self.color_manager.get_rgb('white')
@@ -37,6 +164,12 @@ class BaseRenderer:
         # Load fonts
         self.fonts = self._load_fonts()
 
+        # Stateless helper for weather icon lookups, shared by all draw calls
+        self.weather_processor = WeatherDataProcessor()
+
+        # Wrapped lines keyed by (text, max_width, id(font), max_lines)
+        self._wrap_cache = {}
+
     def _load_fonts(self):
         """
         Load fonts for rendering.
@@ -53,70 +186,57 @@ class BaseRenderer:
         """
         # Font paths in order of preference (best for e-paper first)
         font_paths = {
-            'regular': [
+            'regular': (
                 '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',  # Best for e-paper
                 '/usr/share/fonts/truetype/roboto/Roboto-Regular.ttf',
                 '/usr/share/fonts/truetype/ubuntu/Ubuntu-R.ttf',
                 '/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf',
                 '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
                 'C:/Windows/Fonts/arial.ttf',  # Windows fallback
-            ],
-            'bold': [
+            ),
+            'bold': (
                 '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf',
                 '/usr/share/fonts/truetype/roboto/Roboto-Bold.ttf',
                 '/usr/share/fonts/truetype/ubuntu/Ubuntu-B.ttf',
                 '/usr/share/fonts/truetype/noto/NotoSans-Bold.ttf',
                 '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
                 'C:/Windows/Fonts/arialbd.ttf',
-            ],
-            'weather': [
+            ),
+            'weather': (
                 'C:/Users/kneal/AppData/Local/Microsoft/Windows/Fonts/weathericons-regular-webfont.ttf',
                 '/usr/share/fonts/truetype/weather-icons/weathericons-regular-webfont.ttf',
                 'C:/Windows/Fonts/weathericons-regular-webfont.ttf'
-            ]
+            )
         }
 
         fonts = {}
 
-        # Find best available regular font
-        regular_font = None
-        for path in font_paths['regular']:
-            if os.path.exists(path):
-                regular_font = path
-                self.logger.debug(f"Using font: {os.path.basename(path)}")
-                break
-
-        # Find best available bold font
-        bold_font = None
-        for path in font_paths['bold']:
-            if os.path.exists(path):
-                bold_font = path
-                break
+        # Find best available regular and bold fonts (probed once per process)
+        regular_font = _first_existing(font_paths['regular'])
+        if regular_font:
+            self.logger.debug(f"Using font: {os.path.basename(regular_font)}")
+        bold_font = _first_existing(font_paths['bold'])
 
         try:
             if regular_font and bold_font:
                 # Load regular weight fonts with optimized sizes for e-paper
-                fonts['tiny'] = ImageFont.truetype(regular_font, 10)    # For labels
-                fonts['small'] = ImageFont.truetype(regular_font, 13)   # Slightly larger
-                fonts['normal'] = ImageFont.truetype(regular_font, 15)  # Slightly larger
-                fonts['medium'] = ImageFont.truetype(regular_font, 17)  # Slightly larger
-                fonts['large'] = ImageFont.truetype(bold_font, 21)      # Slightly larger
-                fonts['xlarge'] = ImageFont.truetype(bold_font, 27)     # Slightly larger
+                fonts['tiny'] = _load_font(regular_font, 10)    # For labels
+                fonts['small'] = _load_font(regular_font, 13)   # Slightly larger
+                fonts['normal'] = _load_font(regular_font, 15)  # Slightly larger
+                fonts['medium'] = _load_font(regular_font, 17)  # Slightly larger
+                fonts['large'] = _load_font(bold_font, 21)      # Slightly larger
+                fonts['xlarge'] = _load_font(bold_font, 27)     # Slightly larger
                 
                 # Try to load weather icons font
-                weather_font_loaded = False
-                self.logger.debug(f"Looking for weather icons font in:")
-                for path in font_paths['weather']:
-                    self.logger.debug(f"  Checking: {path} (exists: {os.path.exists(path)})")
-                    if os.path.exists(path):
-                        fonts['weather_tiny'] = ImageFont.truetype(path, 14)
-                        fonts['weather_small'] = ImageFont.truetype(path, 22)
-                        fonts['weather_medium'] = ImageFont.truetype(path, 30)
-                        fonts['weather_large'] = ImageFont.truetype(path, 38)
-                        weather_font_loaded = True
-                        self.logger.debug(f"  [+] Found weather icons font at: {path}")
-                        break
-                
+                weather_font = _first_existing(font_paths['weather'])
+                weather_font_loaded = weather_font is not None
+                if weather_font_loaded:
+                    fonts['weather_tiny'] = _load_font(weather_font, 14)
+                    fonts['weather_small'] = _load_font(weather_font, 22)
+                    fonts['weather_medium'] = _load_font(weather_font, 30)
+                    fonts['weather_large'] = _load_font(weather_font, 38)
+                    self.logger.debug(f"Found weather icons font at: {weather_font}")
+
                 if not weather_font_loaded:
                     self.logger.warning("Weather Icons font not found, weather icons may not render correctly")
                     # Check if font might be in a different location
@@ -174,15 +294,44 @@ class BaseRenderer:
         # but not green (0,255,0) = 182.4, red (255,0,0) = 54.2, blue (0,0,255) = 18.4
         return luminance > 200
 
-    def create_canvas(self):
+    def create_canvas(self, reuse=False):
         """
         Create a blank canvas with white background.
 
+        In 'P' mode each pixel is a single palette byte; colors are added to
+        the palette as they are first drawn, so RGB tuples work unchanged.
+        The display driver converts back to RGB before quantizing.
+
+        Args:
+            reuse: Return the shared pooled canvas, cleared to white, instead
+                of allocating a new one. Only for images handed straight to the
+                display; the next reusing render overwrites it. A pooled palette
+                canvas also gets a fresh palette, so colors from earlier renders
+                don't carry over.
+
         Returns:
             tuple: (Image, ImageDraw) objects
         """
-        image = Image.new('RGB', (self.width, self.height), self.white)
+        key = (self.canvas_mode, self.width, self.height)
+        if reuse:
+            pooled = BaseRenderer._canvas_pool.get(key)
+            if pooled is not None:
+                image, draw = pooled
+                if self.canvas_mode == 'P':
+                    # Same state Image.new leaves: white is the only palette entry.
+                    # ImageDraw keeps a reference to the palette, so draw anew
+                    image.palette = ImagePalette.ImagePalette()
+                    image.paste(image.palette.getcolor(self.white), (0, 0, self.width, self.height))
+                    draw = ImageDraw.Draw(image)
+                    BaseRenderer._canvas_pool[key] = (image, draw)
+                else:
+                    draw.rectangle([(0, 0), (self.width, self.height)], fill=self.white)
+                return image, draw
+
+        image = Image.new(self.canvas_mode, (self.width, self.height), self.white)
         draw = ImageDraw.Draw(image)
+        if reuse:
+            BaseRenderer._canvas_pool[key] = (image, draw)
         return image, draw
 
     def get_weather_icon_for_date(self, weather_info, date_obj):
@@ -200,17 +349,81 @@ class BaseRenderer:
             return None, None
         
         date_key = date_obj.isoformat()  # YYYY-MM-DD format
-        forecast = weather_info.forecast.get(date_key)
-        
+        return self.get_weather_icon_for_forecast(weather_info.forecast.get(date_key))
+
+    def get_weather_icon_for_forecast(self, forecast):
+        """
+        Get weather icon for an already looked-up day forecast.
+
+        Args:
+            forecast: DayForecast object or None
+
+        Returns:
+            tuple: (icon_str, condition_str) or (None, None) if forecast is None
+        """
         if not forecast:
             return None, None
-        
-        from weather_data import WeatherDataProcessor
-        weather_processor = WeatherDataProcessor()
-        icon = weather_processor.get_weather_icon(forecast.condition.lower())
+
+        icon = self.weather_processor.get_weather_icon(forecast.condition.lower())
         
         return icon, forecast.condition
 
+    def format_temp(self, temperature):
+        """
+        Format a temperature as a whole number of degrees (e.g. '72°').
+
+        Args:
+            temperature: Temperature value (int or float)
+
+        Returns:
+            str: Formatted temperature string
+        """
+        return _format_degrees(int(temperature))
+
+    def format_time(self, dt, fmt="%I:%M %p"):
+        """
+        Format the time of day of a datetime (e.g. '09:00 AM').
+
+        Recurring events share start times, so the strings are cached.
+
+        Args:
+            dt: datetime or time object
+            fmt: strftime format using only hour/minute/AM-PM fields
+
+        Returns:
+            str: Formatted time string
+        """
+        return _format_clock(dt.hour, dt.minute, fmt)
+
+    def _measure_width(self, draw, text, font):
+        """
+        Measure the pixel width of text, caching the result per font.
+
+        Args:
+            draw: ImageDraw object the text will be drawn with
+            text: Text to measure
+            font: Font object
+
+        Returns:
+            int: Width of the text's bounding box
+        """
+        left, _, right, _ = _text_bbox(font, text, draw.fontmode)
+        return right - left
+
+    def _text_bbox(self, draw, text, font):
+        """
+        Measure text as draw.textbbox((0, 0), ...) would, caching the result.
+
+        Args:
+            draw: ImageDraw object the text will be drawn with
+            text: Text to measure
+            font: Font object
+
+        Returns:
+            tuple: (left, top, right, bottom) bounding box
+        """
+        return _text_bbox(font, text, draw.fontmode)
+
     def draw_text(self, draw, text, x, y, font, color, max_width=None, align='left'):
         """
         Draw text with optional truncation.
@@ -232,7 +445,7 @@ class BaseRenderer:
             text = self.truncate_text(text, max_width, font, draw)
 
         # Calculate text bbox for alignment
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = self._text_bbox(draw, text, font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -246,6 +459,30 @@ class BaseRenderer:
 
         return text_width, text_height
 
+    def draw_text_cached(self, draw, text, x, y, font, color):
+        """
+        Draw left-aligned text from a cached pre-rasterized sprite.
+
+        For strings that repeat across refreshes (header date, legend names),
+        the glyphs are shaped and rasterized once and later frames only blit
+        the coverage mask, which gives the same pixels as draw.text.
+
+        Args:
+            draw: ImageDraw object
+            text: Text to draw
+            x: X coordinate
+            y: Y coordinate
+            font: Font object
+            color: RGB color tuple
+
+        Returns:
+            tuple: (width, height) of drawn text
+        """
+        sprite, left, top = _text_sprite(font, text, draw.fontmode)
+        draw.bitmap((x + left, y + top), sprite, fill=color)
+        left, top, right, bottom = self._text_bbox(draw, text, font)
+        return right - left, bottom - top
+
     def draw_text_with_outline(self, draw, text, x, y, font, color, outline_color=None, align='left'):
         """
         Draw text with a bold outline for better visibility.
@@ -267,7 +504,7 @@ class BaseRenderer:
             outline_color = self.black
 
         # Calculate text bbox for alignment
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = self._text_bbox(draw, text, font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
@@ -302,20 +539,25 @@ class BaseRenderer:
         Returns:
             str: Truncated text with ellipsis if needed
         """
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = self._text_bbox(draw, text, font)
         text_width = bbox[2] - bbox[0]
 
         if text_width <= max_width:
             return text
 
-        # Truncate with ellipsis
+        # Binary search for the longest prefix that fits with the ellipsis,
+        # so long titles need O(log n) measurements instead of one per char
         ellipsis = '...'
-        while text and text_width > max_width:
-            text = text[:-1]
-            bbox = draw.textbbox((0, 0), text + ellipsis, font=font)
-            text_width = bbox[2] - bbox[0]
+        lo, hi = 0, len(text) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            bbox = self._text_bbox(draw, text[:mid] + ellipsis, font)
+            if bbox[2] - bbox[0] <= max_width:
+                lo = mid
+            else:
+                hi = mid - 1
 
-        return text + ellipsis if text else ellipsis
+        return text[:lo] + ellipsis
 
     def wrap_text(self, text, max_width, font, draw, max_lines=2):
         """
@@ -330,35 +572,90 @@ class BaseRenderer:
 
         Returns:
             list: List of text lines
-        """
+
+        Note:
+            Widths are measured with font.getlength() (Pillow 9.2+), which
+            returns the advance width without computing vertical metrics.
+            Line breaks are found by estimating from the font's average
+            character width and adjusting one word at a time, so a line
+            costs a few measurements rather than one per word.
+            Results are cached per (text, max_width, font, max_lines) so
+            recurring event titles are only wrapped once per renderer.
+        """
+        cache_key = (text, max_width, id(font), max_lines)
+        cached = self._wrap_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Most titles fit on one line; one measurement avoids per-word probes.
+        # Leading spaces are dropped by the word loop, so those go through it
+        if text and not text.startswith(' ') and int(font.getlength(text)) <= max_width:
+            lines = [text]
+            self._wrap_cache[cache_key] = lines
+            return lines
+
         words = text.split(' ')
+        num_words = len(words)
         lines = []
         current_line = ''
         words_used = 0
+        avg_char_width = _avg_char_width(font)
 
-        for i, word in enumerate(words):
-            test_line = current_line + (' ' if current_line else '') + word
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            test_width = bbox[2] - bbox[0]
+        def fits(line):
+            return int(font.getlength(line)) <= max_width
 
-            if test_width <= max_width:
-                current_line = test_line
-                words_used = i + 1
-            else:
-                if current_line:
-                    lines.append(current_line)
-                    if len(lines) >= max_lines:
-                        break
+        i = 0
+        while i < num_words:
+            word = words[i]
+
+            if not current_line:
+                # Start of a line: the first word must fit on its own
+                if fits(word):
                     current_line = word
-                    words_used = i + 1
                 else:
                     # Single word is too long, truncate it
-                    current_line = self.truncate_text(word, max_width, font, draw)
-                    lines.append(current_line)
-                    words_used = i + 1
+                    lines.append(self.truncate_text(word, max_width, font, draw))
                     if len(lines) >= max_lines:
+                        words_used = i + 1
                         break
-                    current_line = ''
+                words_used = i + 1
+                i += 1
+                continue
+
+            # Estimate how many of the following words fit from the average
+            # character width, then grow or shrink by one word to the exact
+            # greedy break instead of measuring every word in turn
+            budget = (max_width - font.getlength(current_line)) / avg_char_width
+            end = i
+            chars = 0
+            while end < num_words and chars + 1 + len(words[end]) <= budget:
+                chars += 1 + len(words[end])
+                end += 1
+
+            prefix = current_line + ' '
+            end = max(end, i + 1)
+            if fits(prefix + ' '.join(words[i:end])):
+                while end < num_words and fits(prefix + ' '.join(words[i:end + 1])):
+                    end += 1
+            else:
+                end -= 1
+                while end > i and not fits(prefix + ' '.join(words[i:end])):
+                    end -= 1
+
+            if end > i:
+                current_line = prefix + ' '.join(words[i:end])
+                words_used = end
+                i = end
+                if i >= num_words:
+                    break
+
+            # words[i] does not fit: close the line and start the next with it
+            lines.append(current_line)
+            if len(lines) >= max_lines:
+                break
+            current_line = words[i]
+            words_used = i + 1
+            i += 1
 
         # Add remaining text if we haven't hit max lines
         if current_line and len(lines) < max_lines:
@@ -371,10 +668,10 @@ class BaseRenderer:
             last_line = lines[-1]
             ellipsis = '...'
             # Make room for ellipsis
-            bbox = draw.textbbox((0, 0), ellipsis, font=font)
-            ellipsis_width = bbox[2] - bbox[0]
+            ellipsis_width = int(font.getlength(ellipsis))
             lines[-1] = self.truncate_text(last_line, max_width - ellipsis_width, font, draw) + ellipsis
 
+        self._wrap_cache[cache_key] = lines
         return lines
 
     def draw_box(self, draw, x, y, width, height, fill=None, outline=None, outline_width=1):
@@ -413,17 +710,13 @@ class BaseRenderer:
         text_y = (height - 26) // 2  # Center the xlarge font (26px) vertically
 
         # Draw current date in white (left side)
-        today = datetime.now()
-        date_str = today.strftime("%A, %B %d, %Y")
-        self.draw_text(draw, date_str, 20, text_y, self.fonts['xlarge'], self.white)
+        date_str = _format_long_date(datetime.now().date())
+        self.draw_text_cached(draw, date_str, 20, text_y, self.fonts['xlarge'], self.white)
 
         # Draw weather on right side if available (same vertical position)
         if weather_info:
-            from weather_data import WeatherDataProcessor
-            weather_processor = WeatherDataProcessor()
-            
             # Get icon and temperature separately
-            icon = weather_processor.get_weather_icon(weather_info.condition.lower())
+            icon = self.weather_processor.get_weather_icon(weather_info.condition.lower())
             temp_str = f"{weather_info.temperature:.0f}{weather_info.temperature_unit}"
             
             # Use weather icon font for icon, regular font for temperature
@@ -431,11 +724,11 @@ class BaseRenderer:
             temp_font = self.fonts['medium']
             
             # Calculate position from right edge (measure temperature first for positioning)
-            temp_bbox = draw.textbbox((0, 0), temp_str, font=temp_font)
+            temp_bbox = self._text_bbox(draw, temp_str, temp_font)
             temp_width = temp_bbox[2] - temp_bbox[0]
             
             # Measure icon width
-            icon_bbox = draw.textbbox((0, 0), icon, font=weather_icon_font)
+            icon_bbox = self._text_bbox(draw, icon, weather_icon_font)
             icon_width = icon_bbox[2] - icon_bbox[0]
             
             # Position from right edge (icon + space + temp)
@@ -492,8 +785,8 @@ class BaseRenderer:
                 label, value = footer_sensor_text.split(": ", 1)
                 
                 # Measure text widths for right alignment
-                bbox_label = draw.textbbox((0, 0), label, font=self.fonts['tiny'])
-                bbox_value = draw.textbbox((0, 0), value, font=self.fonts['small'])
+                bbox_label = self._text_bbox(draw, label, self.fonts['tiny'])
+                bbox_value = self._text_bbox(draw, value, self.fonts['small'])
                 label_width = bbox_label[2] - bbox_label[0]
                 value_width = bbox_value[2] - bbox_value[0]
                 
@@ -506,7 +799,7 @@ class BaseRenderer:
                 self.draw_text(draw, value, right_x_value, time_y, self.fonts['small'], self.black)
             else:
                 # No colon, just display as single text
-                bbox = draw.textbbox((0, 0), footer_sensor_text, font=self.fonts['small'])
+                bbox = self._text_bbox(draw, footer_sensor_text, self.fonts['small'])
                 text_width = bbox[2] - bbox[0]
                 right_x = self.width - text_width - 10
                 text_y = footer_y + (height - 14) // 2
@@ -522,7 +815,7 @@ class BaseRenderer:
             events_by_day: Dictionary mapping date to DayEvents
 
         Returns:
-            dict: {calendar_name: color} (insertion-ordered, up to 3)
+            dict: {calendar_name: color} (insertion-ordered, up to LEGEND_MAX_ITEMS)
         """
         legend = {}
         for day_events in events_by_day.values():
@@ -530,6 +823,9 @@ class BaseRenderer:
                 for event in day_events.events:
                     if event.calendar_name and event.calendar_name not in legend:
                         legend[event.calendar_name] = event.color
+                        # Only the first few are drawn, so stop once they're found
+                        if len(legend) >= self.LEGEND_MAX_ITEMS:
+                            return legend
         return legend
 
     def draw_calendar_legend(self, draw, footer_y, footer_height, calendar_legend):
@@ -540,20 +836,20 @@ class BaseRenderer:
             draw: ImageDraw object
             footer_y: Y coordinate where the footer starts
             footer_height: Height of the footer in pixels
-            calendar_legend: dict {calendar_name: color} (up to 3 shown)
+            calendar_legend: dict {calendar_name: color} (up to LEGEND_MAX_ITEMS shown)
         """
         if not calendar_legend:
             return
         dot_size = 12
         dot_text_gap = 5
         item_gap = 18
-        legend_items = list(calendar_legend.items())[:3]
+        legend_items = list(calendar_legend.items())[:self.LEGEND_MAX_ITEMS]
 
         # Measure total legend width
         total_legend_width = 0
         item_widths = []
         for cal_name, _ in legend_items:
-            bbox = draw.textbbox((0, 0), cal_name, font=self.fonts['small'])
+            bbox = self._text_bbox(draw, cal_name, self.fonts['small'])
             text_w = bbox[2] - bbox[0]
             item_w = dot_size + dot_text_gap + text_w
             item_widths.append(item_w)
@@ -569,7 +865,7 @@ class BaseRenderer:
             outline_width = 2 if outline_color else 1
             self.draw_box(draw, legend_x, legend_y, dot_size, dot_size, 
                          fill=cal_color, outline=outline_color, outline_width=outline_width)
-            self.draw_text(
+            self.draw_text_cached(
                 draw, cal_name,
                 legend_x + dot_size + dot_text_gap,
                 legend_y,
@@ -592,18 +888,23 @@ class BaseRenderer:
         legend_height = 30
         x = 20
         spacing = 150
+        box_size = 15
+
+        # Loop invariants bound once; boxes drawn directly instead of via draw_box
+        box_y = y_start + 8
+        text_y = y_start + 8
+        black = self.black
+        font = self.fonts['normal']
+        rectangle = draw.rectangle
+        draw_text_cached = self.draw_text_cached
 
-        for i, cal_info in enumerate(calendars):
+        for box_x, cal_info in zip(range(x, x + spacing * len(calendars), spacing), calendars):
             # Draw color box
-            box_size = 15
-            box_x = x + (i * spacing)
-            box_y = y_start + 8
-            self.draw_box(draw, box_x, box_y, box_size, box_size, fill=cal_info['color'], outline=self.black)
+            rectangle([(box_x, box_y), (box_x + box_size, box_y + box_size)],
+                      fill=cal_info['color'], outline=black, width=1)
 
             # Draw calendar name
-            text_x = box_x + box_size + 8
-            text_y = y_start + 8
-            self.draw_text(draw, cal_info['name'], text_x, text_y, self.fonts['normal'], self.black)
+            draw_text_cached(draw, cal_info['name'], box_x + box_size + 8, text_y, font, black)
 
         return y_start + legend_height
 
@@ -629,9 +930,11 @@ class BaseRenderer:
         )
 
     def _get_all_day_span_lanes(self, dates, events_by_day, max_lanes=3):
-        row_start = dates[0]
-        row_end = dates[-1]
+        # Work on day ordinals relative to the row; dates are consecutive days
+        row_start_ord = dates[0].toordinal()
+        row_end_ord = dates[-1].toordinal()
         span_events = {}
+        span_ids = set()
 
         for day in dates:
             day_events = events_by_day.get(day)
@@ -639,48 +942,46 @@ class BaseRenderer:
                 continue
 
             for event in day_events.events:
-                if not event.all_day:
+                # Multi-day events repeat on each day they cover; key them once
+                if not event.all_day or id(event) in span_ids:
                     continue
 
-                end_inclusive = event.end.date() - timedelta(days=1)
-                if end_inclusive <= event.start.date():
+                start_ord = event.start.date().toordinal()
+                end_ord = event.end.date().toordinal() - 1  # inclusive
+                if end_ord <= start_ord:
                     continue
 
-                if end_inclusive < row_start or event.start.date() > row_end:
+                if end_ord < row_start_ord or start_ord > row_end_ord:
                     continue
 
-                span_events[self._event_key(event)] = event
-
-        spans = []
-        for event in span_events.values():
-            start_date = event.start.date()
-            end_inclusive = event.end.date() - timedelta(days=1)
-            span_start = max(start_date, row_start)
-            span_end = min(end_inclusive, row_end)
-            start_idx = dates.index(span_start)
-            end_idx = dates.index(span_end)
-            spans.append((start_idx, end_idx, event))
+                span_events[self._event_key(event)] = (start_ord, end_ord, event)
+                span_ids.add(id(event))
 
+        spans = [
+            (max(start_ord, row_start_ord) - row_start_ord,
+             min(end_ord, row_end_ord) - row_start_ord,
+             event)
+            for start_ord, end_ord, event in span_events.values()
+        ]
         spans.sort(key=lambda s: (s[0], (s[1] - s[0]), s[2].title))
 
-        lanes = []
-        overflow = 0
-
-        for span in spans:
-            placed = False
-            for lane in lanes:
-                if all(span[1] < existing[0] or span[0] > existing[1] for existing in lane):
-                    lane.append(span)
-                    placed = True
-                    break
+        # Spans arrive in start order, so a span fits a lane once it starts
+        # after the last column that lane is busy until
+        assigned = _pack_lanes([s[0] for s in spans], [s[1] for s in spans], max_lanes)
 
-            if not placed:
-                if len(lanes) < max_lanes:
-                    lanes.append([span])
-                else:
-                    overflow += 1
+        lanes = [[] for _ in range(min(max_lanes, len(spans)))]
+        overflow = 0
+        for span, lane_idx in zip(spans, assigned):
+            if lane_idx < 0:
+                overflow += 1
+            else:
+                lanes[lane_idx].append(span)
+        # Drop lanes that were never opened
+        lanes = [lane for lane in lanes if lane]
 
-        return lanes, overflow, set(span_events.keys())
+        # Identities of every event drawn as a span, so day cells can drop
+        # them with a plain set lookup instead of rebuilding _event_key
+        return lanes, overflow, frozenset(span_ids)
 
     def _draw_all_day_spans(self, draw, y, col_width, lanes, lane_height):
         if not lanes:
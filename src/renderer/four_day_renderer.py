@@ -30,7 +30,7 @@ class FourDayRenderer(BaseRenderer):
         Returns:
             PIL.Image: Rendered calendar image
         """
-        image, draw = self.create_canvas()
+        image, draw = self.create_canvas(reuse=True)
 
         # No header - grid extends to top
         y = 0
@@ -95,7 +95,7 @@ class FourDayRenderer(BaseRenderer):
             day_events: DayEvents object or None
             is_today: Boolean indicating if this is today
             all_day_height: Height of all-day event lanes
-            span_keys: Set of span event keys
+            span_keys: Frozenset of id() for events drawn as all-day spans
             weather_info: WeatherInfo object for today's weather (for first column only)
         """
         # Draw column border
@@ -130,7 +130,7 @@ class FourDayRenderer(BaseRenderer):
                 date_key = date_obj.isoformat()
                 forecast = weather_info.forecast.get(date_key)
                 if forecast and forecast.temperature:
-                    temp_str = f"{int(forecast.temperature)}°"
+                    temp_str = self.format_temp(forecast.temperature)
 
             if icon or temp_str:
                 weather_icon_font = self.fonts.get('weather_medium', self.fonts['medium'])
@@ -139,13 +139,11 @@ class FourDayRenderer(BaseRenderer):
                 # Measure widths separately
                 icon_width = 0
                 if icon:
-                    icon_bbox = draw.textbbox((0, 0), icon, font=weather_icon_font)
-                    icon_width = icon_bbox[2] - icon_bbox[0]
+                    icon_width = self._measure_width(draw, icon, weather_icon_font)
                 
                 temp_width = 0
                 if temp_str:
-                    temp_bbox = draw.textbbox((0, 0), temp_str, font=temp_font)
-                    temp_width = temp_bbox[2] - temp_bbox[0]
+                    temp_width = self._measure_width(draw, temp_str, temp_font)
                 
                 # Position from right edge of column (icon + space + temp)
                 total_width = icon_width + (8 if icon and temp_str else 0) + temp_width
@@ -189,7 +187,7 @@ class FourDayRenderer(BaseRenderer):
         max_events = self.view_config.get('max_events_per_day', 10)
         show_time = self.view_config.get('show_time', True)
 
-        filtered_events = [event for event in day_events.events if self._event_key(event) not in span_keys]
+        filtered_events = [event for event in day_events.events if id(event) not in span_keys]
         # Sort by start time so time-positioning is meaningful
         filtered_events.sort(key=lambda e: e.start)
         events_to_show = filtered_events[:max_events]
@@ -213,13 +211,15 @@ class FourDayRenderer(BaseRenderer):
         start_hour = 6
         end_hour = 22
         pixels_per_hour = height / (end_hour - start_hour)
+        # y of each whole hour, so on-the-hour starts skip the float math
+        y_of_hour = [y + int(h * pixels_per_hour) for h in range(end_hour - start_hour + 1)]
 
         current_y = y  # minimum y for next bar (prevents overlapping previous bar)
 
         for event in events_to_show:
             # Format event text
             if show_time and not event.all_day:
-                time_str = event.start.strftime("%I:%M %p")
+                time_str = self.format_time(event.start)
                 event_text = f"{time_str} {event.title}"
             else:
                 event_text = event.title
@@ -227,6 +227,8 @@ class FourDayRenderer(BaseRenderer):
             # Calculate time-based y; all-day events start at top
             if event.all_day:
                 time_y = y
+            elif event.start.minute == 0:
+                time_y = y_of_hour[max(start_hour, min(end_hour, event.start.hour)) - start_hour]
             else:
                 event_hour = max(start_hour, min(end_hour, event.start.hour + event.start.minute / 60.0))
                 time_y = y + int((event_hour - start_hour) * pixels_per_hour)
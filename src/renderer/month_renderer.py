@@ -2,12 +2,23 @@
 
 from datetime import datetime, date, timedelta
 from calendar import monthrange
+from PIL import Image, ImageDraw
 from renderer.base_renderer import BaseRenderer
 
 
 class MonthRenderer(BaseRenderer):
     """Renders a traditional month calendar view."""
 
+    HEADER_HEIGHT = 50      # Blue header with month name and forecast
+    DAY_HEADER_HEIGHT = 20  # Row of day-name labels
+    FOOTER_HEIGHT = 40      # Footer with last updated time
+
+    # Static month scaffolding shared across renders: {(year, month, w, h, mode): Image}
+    _bg_cache = {}
+
+    # Prerendered event indicator sprites: {(color, dot_size): Image}
+    _dot_sprites = {}
+
     def __init__(self, config, color_manager):
         """
         Initialize month renderer.
@@ -19,6 +30,17 @@ class MonthRenderer(BaseRenderer):
         super().__init__(config, color_manager)
         self.view_config = config['views']['month']
 
+        # Day header labels only depend on the display width
+        col_width = self.width // 7
+        day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        self._day_header_positions = [
+            (i * col_width + col_width // 2, day_name)
+            for i, day_name in enumerate(day_names)
+        ]
+
+        # Cell positions per grid shape, filled on first render
+        self._cell_xy = {}
+
     def render(self, events_by_day, weather_info, footer_sensor_text=None, **kwargs):
         """
         Render month calendar view.
@@ -31,28 +53,18 @@ class MonthRenderer(BaseRenderer):
         Returns:
             PIL.Image: Rendered calendar image
         """
-        image, draw = self.create_canvas()
-
         # No header - grid extends to top
         y = 0
 
-        # Calculate grid dimensions
-        # Layout: Up to 6 rows (weeks) x 7 columns (days)
-        footer_height = 40  # Footer with last updated time
-        available_height = self.height - footer_height
-        
         # Get current month info
         today = date.today()
         year, month = today.year, today.month
-        _, last_day = monthrange(year, month)
-        
-        # Draw blue header with month name and 3-day forecast inline
-        header_height = 50
-        self.draw_box(draw, 0, 0, self.width, header_height, fill=self.blue)
-        
-        # Draw month name on left side
-        month_name = today.strftime("%B %Y")
-        self.draw_text(draw, month_name, 20, y + 8, self.fonts['large'], self.white)
+
+        # Start from the cached month scaffolding (title, day headers, borders)
+        image = self._get_or_build_background(year, month).copy()
+        draw = ImageDraw.Draw(image)
+
+        calendar_start, weeks_needed, row_height, col_width = self._grid_layout(year, month)
         
         # Draw 3-day forecast inline on right side
         if weather_info and weather_info.forecast:
@@ -66,10 +78,8 @@ class MonthRenderer(BaseRenderer):
                 forecast = weather_info.forecast.get(date_key)
                 
                 if forecast:
-                    from weather_data import WeatherDataProcessor
-                    weather_processor = WeatherDataProcessor()
-                    icon = weather_processor.get_weather_icon(forecast.condition.lower())
-                    temp_str = f"{int(forecast.temperature)}°"
+                    icon = self.weather_processor.get_weather_icon(forecast.condition.lower())
+                    temp_str = self.format_temp(forecast.temperature)
                     
                     # Position for this day's forecast (compact, inline)
                     x_pos = forecast_start_x + (day_offset * forecast_item_width)
@@ -86,76 +96,166 @@ class MonthRenderer(BaseRenderer):
                     # Draw temperature (inline with icon, with more spacing)
                     self.draw_text(draw, temp_str, x_pos + 22, forecast_y + 14, self.fonts['small'], self.white)
 
-        # Calculate grid dimensions
-        grid_y = header_height
-        day_header_height = 20
+        # Draw calendar grid - show only weeks needed, but stretched to fill space
+        base_ord = calendar_start.toordinal()
+
+        # Look up each visible day's events once, indexed by grid position
+        day_events_list = [
+            events_by_day.get(date.fromordinal(base_ord + i))
+            for i in range(weeks_needed * 7)
+        ]
         
+        # Show only the weeks needed for current month
+        for idx, (x, y) in enumerate(self._cell_positions(weeks_needed, row_height, col_width)):
+            current_date = date.fromordinal(base_ord + idx)
+
+            # Check if this date is in current month
+            in_current_month = (current_date.month == month)
+            is_today = (current_date == today)
+
+            # Draw cell (no weather on today)
+            self._draw_day_cell(
+                image,
+                draw,
+                x,
+                y,
+                col_width,
+                row_height,
+                current_date,
+                day_events_list[idx],
+                is_today,
+                in_current_month,
+                None,
+                month,
+                year
+            )
+
+        # Draw footer with last updated time and calendar legend
+        available_height = self.height - self.FOOTER_HEIGHT
+        self.draw_footer(draw, available_height, self.FOOTER_HEIGHT, footer_sensor_text)
+        calendar_legend = self._collect_calendar_legend(events_by_day)
+        self.draw_calendar_legend(draw, available_height, self.FOOTER_HEIGHT, calendar_legend)
+
+        self.logger.info("Rendered month calendar view")
+        return image
+
+    def _grid_layout(self, year, month):
+        """
+        Calculate the month grid layout.
+
+        Args:
+            year: Year being displayed
+            month: Month being displayed
+
+        Returns:
+            tuple: (calendar_start, weeks_needed, row_height, col_width)
+        """
+        _, last_day = monthrange(year, month)
+
         # Calculate minimum number of weeks needed to display current month
         first_day = date(year, month, 1)
         days_to_monday = first_day.weekday()  # 0=Monday
         calendar_start = first_day - timedelta(days=days_to_monday)
-        
+
         last_day_of_month = date(year, month, last_day)
         days_from_start_to_last = (last_day_of_month - calendar_start).days
         weeks_needed = (days_from_start_to_last // 7) + 1
-        
+
         # Calculate available space for calendar grid and stretch to fill it
-        grid_content_height = available_height - header_height - day_header_height
+        available_height = self.height - self.FOOTER_HEIGHT
+        grid_content_height = available_height - self.HEADER_HEIGHT - self.DAY_HEADER_HEIGHT
         row_height = grid_content_height // weeks_needed  # Stretch rows to fill available space
         col_width = self.width // 7
 
-        # Draw day headers (Mon, Tue, Wed, Thu, Fri, Sat, Sun)
-        day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        header_y = grid_y + 3
-        for i, day_name in enumerate(day_names):
-            x = i * col_width + col_width // 2
-            self.draw_text(draw, day_name, x, header_y, self.fonts['medium'], self.black, align='center')
+        return calendar_start, weeks_needed, row_height, col_width
 
-        # Draw calendar grid - show only weeks needed, but stretched to fill space
-        grid_start_y = grid_y + day_header_height
-        current_date = calendar_start
-        
-        # Show only the weeks needed for current month
-        for week in range(weeks_needed):
-            for day_col in range(7):
-                x = day_col * col_width
-                y = grid_start_y + (week * row_height)
+    def _cell_positions(self, weeks_needed, row_height, col_width):
+        """
+        Get the top-left (x, y) of every grid cell in row-major order.
 
-                # Check if this date is in current month
-                in_current_month = (current_date.month == month)
-                is_today = (current_date == today)
+        Args:
+            weeks_needed: Number of week rows shown
+            row_height: Height of each row
+            col_width: Width of each column
 
-                # Draw cell (no weather on today)
-                self._draw_day_cell(
-                    draw,
-                    x,
-                    y,
-                    col_width,
-                    row_height,
-                    current_date,
-                    events_by_day.get(current_date),
-                    is_today,
-                    in_current_month,
-                    None,
-                    month,
-                    year
-                )
+        Returns:
+            list: (x, y) tuples, one per cell
+        """
+        key = (weeks_needed, row_height, col_width)
+        positions = self._cell_xy.get(key)
+        if positions is None:
+            grid_start_y = self.HEADER_HEIGHT + self.DAY_HEADER_HEIGHT
+            positions = [
+                (day_col * col_width, grid_start_y + week * row_height)
+                for week in range(weeks_needed)
+                for day_col in range(7)
+            ]
+            self._cell_xy[key] = positions
+        return positions
+
+    def _get_or_build_background(self, year, month):
+        """
+        Get the static month scaffolding, building it once per month.
 
-                current_date += timedelta(days=1)
+        The month title, day-name headers, cell borders and previous-month
+        fills only change when the month rolls over, so they are drawn once
+        and reused as the starting canvas for every render.
 
-        # Draw footer with last updated time and calendar legend
-        self.draw_footer(draw, available_height, footer_height, footer_sensor_text)
-        calendar_legend = self._collect_calendar_legend(events_by_day)
-        self.draw_calendar_legend(draw, available_height, footer_height, calendar_legend)
+        Args:
+            year: Year being displayed
+            month: Month being displayed
 
-        self.logger.info("Rendered month calendar view")
+        Returns:
+            PIL.Image: Cached background image (copy before drawing on it)
+        """
+        key = (year, month, self.width, self.height, self.canvas_mode)
+        background = self._bg_cache.get(key)
+        if background is not None:
+            return background
+
+        image, draw = self.create_canvas()
+        calendar_start, weeks_needed, row_height, col_width = self._grid_layout(year, month)
+
+        # Draw blue header with month name (3-day forecast is drawn per render)
+        self.draw_box(draw, 0, 0, self.width, self.HEADER_HEIGHT, fill=self.blue)
+        month_name = date(year, month, 1).strftime("%B %Y")
+        self.draw_text(draw, month_name, 20, 8, self.fonts['large'], self.white)
+
+        # Draw day headers (Mon, Tue, Wed, Thu, Fri, Sat, Sun)
+        header_y = self.HEADER_HEIGHT + 3
+        for x, day_name in self._day_header_positions:
+            self.draw_text(draw, day_name, x, header_y, self.fonts['medium'], self.black, align='center')
+
+        # Draw cell borders as full grid lines rather than one box per cell
+        grid_start_y = self.HEADER_HEIGHT + self.DAY_HEADER_HEIGHT
+        grid_end_x = 7 * col_width
+        grid_end_y = grid_start_y + weeks_needed * row_height
+        for col in range(8):
+            x = col * col_width
+            draw.line([(x, grid_start_y), (x, grid_end_y)], fill=self.black, width=1)
+        for week in range(weeks_needed + 1):
+            y = grid_start_y + week * row_height
+            draw.line([(0, y), (grid_end_x, y)], fill=self.black, width=1)
+
+        # Grey out days from the previous month
+        light_grey = (211, 211, 211)  # Light grey color
+        base_ord = calendar_start.toordinal()
+        for idx, (x, y) in enumerate(self._cell_positions(weeks_needed, row_height, col_width)):
+            current_date = date.fromordinal(base_ord + idx)
+            if (current_date.year, current_date.month) < (year, month):
+                self.draw_box(draw, x + 1, y + 1, col_width - 2, row_height - 2, fill=light_grey)
+
+        # Only the current month is ever shown, so drop stale months
+        self._bg_cache.clear()
+        self._bg_cache[key] = image
         return image
 
-    def _draw_day_cell(self, draw, x, y, width, height, date_obj, day_events, is_today, in_current_month, weather_info=None, current_month=None, current_year=None):
+    def _draw_day_cell(self, image, draw, x, y, width, height, date_obj, day_events, is_today, in_current_month, weather_info=None, current_month=None, current_year=None):
         """
         Draw a single day cell for month view.
 
         Args:
+            image: PIL Image being drawn on (for pasting indicator sprites)
             draw: ImageDraw object
             x: X coordinate
             y: Y coordinate
@@ -169,19 +269,15 @@ class MonthRenderer(BaseRenderer):
             current_month: Current month number (for distinguishing prev/next month)
             current_year: Current year number (for distinguishing prev/next month)
         """
-        # Draw cell border
-        border_width = 1
-        self.draw_box(draw, x, y, width, height, outline=self.black, outline_width=border_width)
+        # Cell border and previous-month fill come from the cached background
 
         # Check if this is previous month (before current month started)
         is_prev_month = (not in_current_month and 
                         (date_obj.year < current_year or 
                          (date_obj.year == current_year and date_obj.month < current_month)))
         
-        # If previous month, fill with light grey and skip content
+        # Previous month cells are already greyed out; skip content
         if is_prev_month:
-            light_grey = 0xD3D3D3  # Light grey color
-            self.draw_box(draw, x + 1, y + 1, width - 2, height - 2, fill=light_grey)
             return
 
         # Draw blue header background bar for today's date
@@ -203,7 +299,7 @@ class MonthRenderer(BaseRenderer):
                     date_key = date_obj.isoformat()
                     forecast = weather_info.forecast.get(date_key)
                     if forecast and forecast.temperature:
-                        temp_str = f"{int(forecast.temperature)}°"
+                        temp_str = self.format_temp(forecast.temperature)
 
                 if icon or temp_str:
                     weather_icon_font = self.fonts.get('weather_small', self.fonts['small'])
@@ -212,13 +308,11 @@ class MonthRenderer(BaseRenderer):
                     # Measure widths separately
                     icon_width = 0
                     if icon:
-                        icon_bbox = draw.textbbox((0, 0), icon, font=weather_icon_font)
-                        icon_width = icon_bbox[2] - icon_bbox[0]
+                        icon_width = self._measure_width(draw, icon, weather_icon_font)
                     
                     temp_width = 0
                     if temp_str:
-                        temp_bbox = draw.textbbox((0, 0), temp_str, font=temp_font)
-                        temp_width = temp_bbox[2] - temp_bbox[0]
+                        temp_width = self._measure_width(draw, temp_str, temp_font)
                     
                     # Position from right edge of cell (icon + space + temp)
                     total_width = icon_width + (8 if icon and temp_str else 0) + temp_width
@@ -237,6 +331,7 @@ class MonthRenderer(BaseRenderer):
             # Draw event indicators below the header
             if day_events and day_events.events:
                 self._draw_event_indicators(
+                    image,
                     draw,
                     x + 5,
                     y + header_height + 3,
@@ -268,7 +363,7 @@ class MonthRenderer(BaseRenderer):
                     date_key = date_obj.isoformat()
                     forecast = weather_info.forecast.get(date_key)
                     if forecast and forecast.temperature:
-                        temp_str = f"{int(forecast.temperature)}°"
+                        temp_str = self.format_temp(forecast.temperature)
 
                 if icon or temp_str:
                     weather_icon_font = self.fonts.get('weather_small', self.fonts['small'])
@@ -277,13 +372,11 @@ class MonthRenderer(BaseRenderer):
                     # Measure widths separately
                     icon_width = 0
                     if icon:
-                        icon_bbox = draw.textbbox((0, 0), icon, font=weather_icon_font)
-                        icon_width = icon_bbox[2] - icon_bbox[0]
+                        icon_width = self._measure_width(draw, icon, weather_icon_font)
                     
                     temp_width = 0
                     if temp_str:
-                        temp_bbox = draw.textbbox((0, 0), temp_str, font=temp_font)
-                        temp_width = temp_bbox[2] - temp_bbox[0]
+                        temp_width = self._measure_width(draw, temp_str, temp_font)
                     
                     # Position from right edge of cell (icon + space + temp)
                     total_width = icon_width + (8 if icon and temp_str else 0) + temp_width
@@ -302,6 +395,7 @@ class MonthRenderer(BaseRenderer):
             # Draw event indicators if any
             if day_events and day_events.events and in_current_month:
                 self._draw_event_indicators(
+                    image,
                     draw,
                     x + padding,
                     y + 25,  # Start below the date
@@ -310,11 +404,12 @@ class MonthRenderer(BaseRenderer):
                     day_events
                 )
 
-    def _draw_event_indicators(self, draw, x, y, width, height, day_events):
+    def _draw_event_indicators(self, image, draw, x, y, width, height, day_events):
         """
         Draw event indicators (colored dots/bars) in cell.
 
         Args:
+            image: PIL Image to paste indicator sprites onto
             draw: ImageDraw object
             x: X coordinate for event area
             y: Y coordinate for event area
@@ -347,14 +442,41 @@ class MonthRenderer(BaseRenderer):
                 if current_y + dot_size > y + height:
                     break  # No more space
 
-            # Draw colored indicator with black border for light colors
-            outline_color = self.black if self.is_light_color(event.color) else None
-            outline_width = 1 if outline_color else 0
-            self.draw_box(draw, current_x, current_y, dot_size, dot_size, 
-                         fill=event.color, outline=outline_color, outline_width=outline_width)
+            if image.mode == 'RGB':
+                # Paste prerendered colored indicator
+                image.paste(self._get_dot(event.color, dot_size), (current_x, current_y))
+            else:
+                # RGB sprites would be re-quantized onto a palette canvas
+                self._draw_dot(draw, current_x, current_y, event.color, dot_size)
             current_x += dot_size + 3
 
         # Show count if more events
-        if hasattr(day_events, 'overflow_count') and day_events.overflow_count > 0:
+        if day_events.overflow_count > 0:
             count_text = f"+{day_events.overflow_count}"
             self.draw_text(draw, count_text, x, y + 15, self.fonts['small'], self.black)
+
+    def _get_dot(self, color, dot_size):
+        """
+        Get a prerendered event indicator sprite, building it on first use.
+
+        Args:
+            color: RGB fill color of the indicator
+            dot_size: Indicator size in pixels
+
+        Returns:
+            PIL.Image: Indicator sprite (dot_size + 1 pixels square, like draw_box)
+        """
+        key = (color, dot_size)
+        sprite = self._dot_sprites.get(key)
+        if sprite is None:
+            sprite = Image.new('RGB', (dot_size + 1, dot_size + 1), self.white)
+            self._draw_dot(ImageDraw.Draw(sprite), 0, 0, color, dot_size)
+            self._dot_sprites[key] = sprite
+        return sprite
+
+    def _draw_dot(self, draw, x, y, color, dot_size):
+        """Draw a colored indicator with a black border for light colors."""
+        outline_color = self.black if self.is_light_color(color) else None
+        outline_width = 1 if outline_color else 0
+        self.draw_box(draw, x, y, dot_size, dot_size,
+                     fill=color, outline=outline_color, outline_width=outline_width)
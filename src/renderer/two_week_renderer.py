@@ -30,7 +30,7 @@ class TwoWeekRenderer(BaseRenderer):
         Returns:
             PIL.Image: Rendered calendar image
         """
-        image, draw = self.create_canvas()
+        image, draw = self.create_canvas(reuse=True)
 
         # No header - grid extends to top
         y = 0
@@ -78,8 +78,18 @@ class TwoWeekRenderer(BaseRenderer):
         day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
         today = date.today()
 
-        row_dates = [week_start + timedelta(days=i) for i in range(7)]
+        ws_ord = week_start.toordinal()
+        row_dates = [date.fromordinal(ws_ord + i) for i in range(7)]
         lanes, overflow, span_keys = self._get_all_day_span_lanes(row_dates, events_by_day, max_lanes=3)
+
+        # Key each day's events once, dropping those already drawn as spans
+        row_events = []
+        for d in row_dates:
+            day_events = events_by_day.get(d)
+            row_events.append(
+                [e for e in day_events.events if id(e) not in span_keys]
+                if day_events else []
+            )
         lane_height = 18
         all_day_height = lane_height * len(lanes)
 
@@ -87,7 +97,7 @@ class TwoWeekRenderer(BaseRenderer):
         self._draw_all_day_spans(draw, all_day_top, col_width, lanes, lane_height)
 
         for i in range(7):
-            current_date = week_start + timedelta(days=i)
+            current_date = row_dates[i]
             x = i * col_width
             is_today = (current_date == today)
 
@@ -100,14 +110,13 @@ class TwoWeekRenderer(BaseRenderer):
                 row_height,
                 current_date,
                 day_names[i],
-                events_by_day.get(current_date),
+                row_events[i],
                 is_today,
                 all_day_height,
-                span_keys,
                 weather_info
             )
 
-    def _draw_day_cell(self, draw, x, y, width, height, date_obj, day_name, day_events, is_today, all_day_height, span_keys, weather_info=None):
+    def _draw_day_cell(self, draw, x, y, width, height, date_obj, day_name, cell_events, is_today, all_day_height, weather_info=None):
         """
         Draw a single day cell.
 
@@ -119,10 +128,9 @@ class TwoWeekRenderer(BaseRenderer):
             height: Cell height
             date_obj: Date object for this cell
             day_name: Day name (e.g., 'Mon')
-            day_events: DayEvents object or None
+            cell_events: List of events for this day, excluding all-day spans
             is_today: Boolean indicating if this is today
             all_day_height: Height of all-day event spans
-            span_keys: Set of span event keys
             weather_info: WeatherInfo object (today only)
         """
         # Draw cell border
@@ -151,7 +159,7 @@ class TwoWeekRenderer(BaseRenderer):
                 date_key = date_obj.isoformat()
                 forecast = weather_info.forecast.get(date_key)
                 if forecast and forecast.temperature:
-                    temp_str = f"{int(forecast.temperature)}°"
+                    temp_str = self.format_temp(forecast.temperature)
 
             if icon or temp_str:
                 weather_icon_font = self.fonts.get('weather_tiny', self.fonts['small'])
@@ -160,13 +168,11 @@ class TwoWeekRenderer(BaseRenderer):
                 # Measure widths separately
                 icon_width = 0
                 if icon:
-                    icon_bbox = draw.textbbox((0, 0), icon, font=weather_icon_font)
-                    icon_width = icon_bbox[2] - icon_bbox[0]
+                    icon_width = self._measure_width(draw, icon, weather_icon_font)
 
                 temp_width = 0
                 if temp_str:
-                    temp_bbox = draw.textbbox((0, 0), temp_str, font=temp_font)
-                    temp_width = temp_bbox[2] - temp_bbox[0]
+                    temp_width = self._measure_width(draw, temp_str, temp_font)
 
                 # Position from right edge of cell (icon + space + temp)
                 total_width = icon_width + (6 if icon and temp_str else 0) + temp_width
@@ -183,18 +189,17 @@ class TwoWeekRenderer(BaseRenderer):
                     self.draw_text(draw, temp_str, weather_x, weather_y + 1, temp_font, self.white)
 
         # Draw events if any
-        if day_events and day_events.events:
+        if cell_events:
             self._draw_events_in_cell(
                 draw,
                 text_x,
                 y + header_height + all_day_height,  # Start below the header and all-day spans
                 width - (2 * padding),
                 height - header_height - all_day_height - 2,
-                day_events,
-                span_keys
+                cell_events
             )
 
-    def _draw_events_in_cell(self, draw, x, y, width, height, day_events, span_keys):
+    def _draw_events_in_cell(self, draw, x, y, width, height, filtered_events):
         """
         Draw events within a cell.
 
@@ -204,12 +209,11 @@ class TwoWeekRenderer(BaseRenderer):
             y: Y coordinate for event area
             width: Available width
             height: Available height
-            day_events: DayEvents object
+            filtered_events: List of events to draw (all-day spans already removed)
         """
         max_events = self.view_config.get('max_events_per_day', 3)
         show_time = self.view_config.get('show_time', True)
 
-        filtered_events = [event for event in day_events.events if self._event_key(event) not in span_keys]
         events_to_show = filtered_events[:max_events]
         num_events = len(events_to_show)
         
@@ -233,7 +237,7 @@ class TwoWeekRenderer(BaseRenderer):
         for event in events_to_show:
             # Format event text
             if show_time and not event.all_day:
-                time_str = event.start.strftime("%I:%M %p")
+                time_str = self.format_time(event.start)
                 event_text = f"{time_str} {event.title}"
             else:
                 event_text = event.title
@@ -1,12 +1,33 @@
 """Week calendar renderer."""
 
 from datetime import datetime, date, timedelta
+from heapq import nsmallest
+from operator import attrgetter
+from PIL import Image, ImageDraw
 from renderer.base_renderer import BaseRenderer
 
+DAY_ABBR = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Smallest event bar in the dynamic sizing table; shorter areas fit no bars
+MIN_EVENT_BAR_HEIGHT = 22
+
 
 class WeekRenderer(BaseRenderer):
     """Renders a single week calendar view with larger cells."""
 
+    FOOTER_HEIGHT = 40       # Footer with last updated time
+    DAY_HEADER_HEIGHT = 40   # Blue day/date header bar at the top of each cell
+
+    # Static cell borders and header bars shared across renders: {(w, h, mode): Image}
+    _grid_cache = {}
+
+    # Last drawn week body (everything above the footer): {layout_key: Image}
+    _body_cache = {}
+
+    # Prerendered event bars with their text: {(color, lines, font, ...): Image}
+    _event_sprites = {}
+    EVENT_SPRITE_LIMIT = 512
+
     def __init__(self, config, color_manager):
         """
         Initialize week renderer.
@@ -18,6 +39,15 @@ class WeekRenderer(BaseRenderer):
         super().__init__(config, color_manager)
         self.view_config = config['views']['week']
 
+        # View settings are fixed for the renderer's lifetime; read them once
+        self.max_events = self.view_config.get('max_events_per_day', 5)
+        self.show_time = self.view_config.get('show_time', True)
+
+        # Day cell fonts, resolved once instead of per cell
+        self.header_font = self.fonts['normal']
+        self.weather_icon_font = self.fonts.get('weather_tiny', self.fonts['small'])
+        self.temp_font = self.fonts['small']
+
     def render(self, events_by_day, weather_info, footer_sensor_text=None, **kwargs):
         """
         Render single week view.
@@ -30,51 +60,187 @@ class WeekRenderer(BaseRenderer):
         Returns:
             PIL.Image: Rendered calendar image
         """
-        image, draw = self.create_canvas()
-
         # No header - grid extends to top
         y = 0
 
         # Calculate grid dimensions
         # Layout: 1 row (week) x 7 columns (days) with larger cells
-        footer_height = 40  # Footer with last updated time
-        available_height = self.height - footer_height
-        row_height = available_height
+        footer_height = self.FOOTER_HEIGHT
+        row_height = self.height - footer_height
         col_width = self.width // 7
 
         # Get current week (Monday to Sunday)
         today = date.today()
         week_start = today - timedelta(days=today.weekday())  # Monday of current week
+        week_start_ord = week_start.toordinal()
+        row_dates = [date.fromordinal(week_start_ord + i) for i in range(7)]
+        row_days = tuple(
+            (d, f"{DAY_ABBR[i]} {d.day}", d == today) for i, d in enumerate(row_dates)
+        )
+
+        weather_by_date = self._weather_by_date(weather_info, row_dates)
+
+        # One pass over the events yields both the row signature and the legend
+        events_key, calendar_legend = self._scan_week(row_days, events_by_day)
+
+        # Between refreshes usually only the footer changes, so reuse the
+        # drawn week row while events and weather are unchanged
+        layout_key = self._layout_key(row_days, events_key, weather_by_date)
+        body = self._body_cache.get(layout_key)
+        if body is None:
+            # Start from the prerendered grid so the header bars are not redrawn
+            body = self._get_or_build_grid(row_height, col_width).copy()
+            self._draw_week_row(body, ImageDraw.Draw(body), row_dates, row_days, y, row_height, col_width,
+                                events_by_day, weather_by_date)
+            self._body_cache.clear()
+            self._body_cache[layout_key] = body
+        else:
+            self.logger.debug("Week layout unchanged, reusing cached week row")
 
-        # Draw week row
-        self._draw_week_row(draw, week_start, y, row_height, col_width, events_by_day, weather_info)
+        image = body.copy()
+        draw = ImageDraw.Draw(image)
 
         # Draw footer with last updated time and calendar legend
         footer_y = y + row_height
         self.draw_footer(draw, footer_y, footer_height, footer_sensor_text)
-        calendar_legend = self._collect_calendar_legend(events_by_day)
         self.draw_calendar_legend(draw, footer_y, footer_height, calendar_legend)
 
         self.logger.info("Rendered week calendar view")
         return image
 
-    def _draw_week_row(self, draw, week_start, y, row_height, col_width, events_by_day, weather_info=None):
+    def _get_or_build_grid(self, row_height, col_width):
+        """
+        Get the static week grid, building it once per display size.
+
+        The blue header bars never change between renders, so the grid is
+        drawn once and reused as the starting canvas; _draw_week_row redraws
+        its frame and column lines over the cell contents.
+
+        Args:
+            row_height: Height of the week row
+            col_width: Width of each column
+
+        Returns:
+            PIL.Image: Cached grid image (copy before drawing on it)
+        """
+        key = (self.width, self.height, self.canvas_mode)
+        grid = self._grid_cache.get(key)
+        if grid is not None:
+            return grid
+
+        image, draw = self.create_canvas()
+        header_height = self.DAY_HEADER_HEIGHT
+        grid_width = 7 * col_width
+
+        # One blue bar across all headers; the column lines split it per day
+        self.draw_box(draw, 1, 1, grid_width - 2, header_height - 2, fill=self.blue)
+        self.draw_box(draw, 0, 0, grid_width, row_height, outline=self.black, outline_width=1)
+        for i in range(1, 7):
+            x = i * col_width
+            draw.line([(x, 0), (x, row_height)], fill=self.black, width=1)
+
+        self._grid_cache[key] = image
+        return image
+
+    def _scan_week(self, row_days, events_by_day):
+        """
+        Walk every day's events once, collecting the row signature and legend.
+
+        Args:
+            row_days: Tuple of (date, header text, is_today) for the week
+            events_by_day: Dictionary mapping date to DayEvents
+
+        Returns:
+            tuple: (events_key, calendar_legend) where events_key holds the drawn
+                fields of each row day's events and calendar_legend matches
+                _collect_calendar_legend
+        """
+        row_events = dict.fromkeys(current_date for current_date, _, _ in row_days)
+        legend = {}
+        legend_full = False
+
+        for day, day_events in events_by_day.items():
+            if not day_events or not day_events.events:
+                continue
+            in_row = day in row_events
+            if legend_full and not in_row:
+                continue
+
+            day_key = []
+            for event in day_events.events:
+                if in_row:
+                    day_key.append((event.calendar_id, event.title, event.start,
+                                    event.end, event.all_day, event.color))
+                if not legend_full and event.calendar_name and event.calendar_name not in legend:
+                    legend[event.calendar_name] = event.color
+                    legend_full = len(legend) >= self.LEGEND_MAX_ITEMS
+            if in_row:
+                row_events[day] = tuple(day_key)
+
+        return tuple(row_events.values()), legend
+
+    def _layout_key(self, row_days, events_key, weather_by_date):
+        """
+        Build a hashable signature of everything drawn in the week row.
+
+        Args:
+            row_days: Tuple of (date, header text, is_today) for the week
+            events_key: Per-day event signatures from _scan_week
+            weather_by_date: Mapping of date to (icon, temp_str)
+
+        Returns:
+            tuple: Key that changes whenever the week row would render differently
+        """
+        return (
+            self.width, self.height, self.canvas_mode,
+            self.max_events, self.show_time,
+            row_days,
+            events_key,
+            tuple(sorted(weather_by_date.items())),
+        )
+
+    def _weather_by_date(self, weather_info, row_dates):
+        """
+        Resolve each day's weather icon and temperature once per render.
+
+        Args:
+            weather_info: WeatherInfo object or None
+            row_dates: List of dates in the week
+
+        Returns:
+            dict: Mapping date to (icon, temp_str) for days with weather to show
+        """
+        weather_by_date = {}
+        if not weather_info or not weather_info.forecast:
+            return weather_by_date
+
+        forecast_by_key = weather_info.forecast
+        for current_date in row_dates:
+            # Forecast keys are YYYY-MM-DD strings; format each date only once
+            forecast = forecast_by_key.get(current_date.isoformat())
+            icon, _ = self.get_weather_icon_for_forecast(forecast)
+            temp_str = None
+            if forecast and forecast.temperature:
+                temp_str = self.format_temp(forecast.temperature)
+            if icon or temp_str:
+                weather_by_date[current_date] = (icon, temp_str)
+        return weather_by_date
+
+    def _draw_week_row(self, image, draw, row_dates, row_days, y, row_height, col_width, events_by_day, weather_by_date):
         """
         Draw the week row.
 
         Args:
+            image: PIL Image being drawn on
             draw: ImageDraw object
-            week_start: Date of Monday for this week
+            row_dates: List of dates for Monday to Sunday
+            row_days: Tuple of (date, header text, is_today) for Monday to Sunday
             y: Y coordinate for this row
             row_height: Height of the row
             col_width: Width of each column
             events_by_day: Dictionary mapping date to DayEvents
-            weather_info: WeatherInfo object (for current week only)
+            weather_by_date: Mapping of date to (icon, temp_str)
         """
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        today = date.today()
-
-        row_dates = [week_start + timedelta(days=i) for i in range(7)]
         lanes, overflow, span_keys = self._get_all_day_span_lanes(row_dates, events_by_day, max_lanes=3)
         lane_height = 18
         all_day_height = lane_height * len(lanes)
@@ -82,108 +248,95 @@ class WeekRenderer(BaseRenderer):
         all_day_top = y + 40
         self._draw_all_day_spans(draw, all_day_top, col_width, lanes, lane_height)
 
-        for i in range(7):
-            current_date = week_start + timedelta(days=i)
+        for i, (current_date, header_text, is_today) in enumerate(row_days):
             x = i * col_width
-            is_today = (current_date == today)
 
             # Draw cell
             self._draw_day_cell(
+                image,
                 draw,
                 x,
                 y,
                 col_width,
                 row_height,
                 current_date,
-                day_names[i],
+                header_text,
                 events_by_day.get(current_date),
                 is_today,
                 all_day_height,
                 span_keys,
-                weather_info
+                weather_by_date.get(current_date)
             )
 
-    def _draw_day_cell(self, draw, x, y, width, height, date_obj, day_name, day_events, is_today, all_day_height, span_keys, weather_info=None):
+        # Keep the frame and column lines on top of spans and cell overflow
+        self.draw_box(draw, 0, y, 7 * col_width, row_height, outline=self.black, outline_width=1)
+        for i in range(1, 7):
+            line_x = i * col_width
+            draw.line([(line_x, y), (line_x, y + row_height)], fill=self.black, width=1)
+
+    def _draw_day_cell(self, image, draw, x, y, width, height, date_obj, header_text, day_events, is_today, all_day_height, span_keys, weather=None):
         """
         Draw a single day cell for week view.
 
         Args:
+            image: PIL Image being drawn on
             draw: ImageDraw object
             x: X coordinate
             y: Y coordinate
             width: Cell width
             height: Cell height
             date_obj: Date object for this cell
-            day_name: Full day name (e.g., 'Monday')
+            header_text: Preformatted day name and date (e.g., 'Mon 14')
             day_events: DayEvents object or None
             is_today: Boolean indicating if this is today
             all_day_height: Height of all-day event spans
-            span_keys: Set of span event keys
-            weather_info: WeatherInfo object (today only)
+            span_keys: Frozenset of id() for events drawn as all-day spans
+            weather: Tuple of (icon, temp_str) or None
         """
-        # Draw cell border
-        border_width = 1
-        self.draw_box(draw, x, y, width, height, outline=self.black, outline_width=border_width)
-
-        # Draw blue header background bar (height 40)
-        header_height = 40
-        self.draw_box(draw, x + 1, y + 1, width - 2, header_height - 2, fill=self.blue)
+        # Cell border and blue header bar are drawn by _draw_week_row
+        header_height = self.DAY_HEADER_HEIGHT
 
         # Draw day name and date in white on blue background (inline, slightly larger)
         padding = 5
-        day_name_short = day_name[:3]
-        date_str = f"{date_obj.day}"
-        header_text = f"{day_name_short} {date_str}"
         text_x = x + padding
         text_y = y + 5
         
         # Draw day name and date inline
-        self.draw_text(draw, header_text, text_x, text_y, self.fonts['normal'], self.white)
+        self.draw_text(draw, header_text, text_x, text_y, self.header_font, self.white)
 
         # Draw weather icon and temperature centered below day/date
-        if weather_info:
-            icon, condition = self.get_weather_icon_for_date(weather_info, date_obj)
+        if weather:
+            icon, temp_str = weather
+            weather_icon_font = self.weather_icon_font
+            temp_font = self.temp_font
             
-            # Get temperature for this date from forecast dict
-            temp_str = None
-            if weather_info and weather_info.forecast:
-                date_key = date_obj.isoformat()
-                forecast = weather_info.forecast.get(date_key)
-                if forecast and forecast.temperature:
-                    temp_str = f"{int(forecast.temperature)}°"
-
-            if icon or temp_str:
-                weather_icon_font = self.fonts.get('weather_tiny', self.fonts['small'])
-                temp_font = self.fonts['small']
-                
-                # Measure widths separately
-                icon_width = 0
-                if icon:
-                    icon_bbox = draw.textbbox((0, 0), icon, font=weather_icon_font)
-                    icon_width = icon_bbox[2] - icon_bbox[0]
-                
-                temp_width = 0
-                if temp_str:
-                    temp_bbox = draw.textbbox((0, 0), temp_str, font=temp_font)
-                    temp_width = temp_bbox[2] - temp_bbox[0]
-                
-                # Center weather display horizontally in the column
-                total_width = icon_width + (3 if icon and temp_str else 0) + temp_width
-                weather_x = x + (width - total_width) // 2
-                weather_y = y + 19
-                
-                # Draw icon first
-                if icon:
-                    self.draw_text(draw, icon, weather_x, weather_y, weather_icon_font, self.white)
-                    weather_x += icon_width + 3
-                
-                # Draw temperature
-                if temp_str:
-                    self.draw_text(draw, temp_str, weather_x, weather_y + 1, temp_font, self.white)
+            # Measure widths separately
+            icon_width = 0
+            if icon:
+                icon_width = self._measure_width(draw, icon, weather_icon_font)
+            
+            temp_width = 0
+            if temp_str:
+                temp_width = self._measure_width(draw, temp_str, temp_font)
+            
+            # Center weather display horizontally in the column
+            total_width = icon_width + (3 if icon and temp_str else 0) + temp_width
+            weather_x = x + (width - total_width) // 2
+            weather_y = y + 19
+            
+            # Draw icon first
+            if icon:
+                self.draw_text(draw, icon, weather_x, weather_y, weather_icon_font, self.white)
+                weather_x += icon_width + 3
+            
+            # Draw temperature
+            if temp_str:
+                self.draw_text(draw, temp_str, weather_x, weather_y + 1, temp_font, self.white)
 
         # Draw events if any
         if day_events and day_events.events:
             self._draw_events_in_cell(
+                image,
                 draw,
                 text_x,
                 y + header_height + all_day_height,  # Start below the header and all-day spans
@@ -193,12 +346,13 @@ class WeekRenderer(BaseRenderer):
                 span_keys
             )
 
-    def _draw_events_in_cell(self, draw, x, y, width, height, day_events, span_keys):
+    def _draw_events_in_cell(self, image, draw, x, y, width, height, day_events, span_keys):
         """
         Draw events with time-based vertical positioning and bars that grow to fit wrapped text.
         Events falling earlier in the day appear higher; a tall bar pushes subsequent events down.
 
         Args:
+            image: PIL Image being drawn on
             draw: ImageDraw object
             x: X coordinate for event area
             y: Y coordinate for event area
@@ -206,13 +360,20 @@ class WeekRenderer(BaseRenderer):
             height: Available height
             day_events: DayEvents object
         """
-        max_events = self.view_config.get('max_events_per_day', 5)
-        show_time = self.view_config.get('show_time', True)
+        max_events = self.max_events
+        show_time = self.show_time
+
+        filtered_events = [event for event in day_events.events if id(event) not in span_keys]
 
-        filtered_events = [event for event in day_events.events if self._event_key(event) not in span_keys]
-        # Sort by start time so time-positioning is meaningful
-        filtered_events.sort(key=lambda e: e.start)
-        events_to_show = filtered_events[:max_events]
+        if height < MIN_EVENT_BAR_HEIGHT:
+            # No bar can fit, so skip layout; only the overflow note may show
+            overflow_count = len(filtered_events) - max_events
+            if overflow_count > 0 and height >= 15:
+                self.draw_text(draw, f"+{overflow_count} more", x, y, self.fonts['small'], self.black)
+            return
+
+        # Earliest events first so time-positioning is meaningful
+        events_to_show = nsmallest(max_events, filtered_events, key=attrgetter('start'))
         num_events = len(events_to_show)
 
         # Dynamic sizing based on number of events
@@ -226,20 +387,27 @@ class WeekRenderer(BaseRenderer):
             font_key = 'normal'
         else:
             line_height = 14
-            min_bar_height = 22
+            min_bar_height = MIN_EVENT_BAR_HEIGHT
             font_key = 'small'
 
+        # Bind per-cell constants to locals for the event loop
+        font = self.fonts[font_key]
+        # multiline_text advances by the font's 'A' height plus spacing
+        line_spacing = line_height - font.getbbox("A")[3]
+
         # Time range: 6 AM to 10 PM
         start_hour = 6
         end_hour = 22
         pixels_per_hour = height / (end_hour - start_hour)
+        # y of each whole hour, so on-the-hour starts skip the float math
+        y_of_hour = [y + int(h * pixels_per_hour) for h in range(end_hour - start_hour + 1)]
 
         current_y = y  # minimum y for next bar (prevents overlapping previous bar)
 
         for event in events_to_show:
             # Format event text
             if show_time and not event.all_day:
-                time_str = event.start.strftime("%I:%M %p")
+                time_str = self.format_time(event.start)
                 event_text = f"{time_str} {event.title}"
             else:
                 event_text = event.title
@@ -247,6 +415,8 @@ class WeekRenderer(BaseRenderer):
             # Calculate time-based y; all-day events start at top
             if event.all_day:
                 time_y = y
+            elif event.start.minute == 0:
+                time_y = y_of_hour[max(start_hour, min(end_hour, event.start.hour)) - start_hour]
             else:
                 event_hour = max(start_hour, min(end_hour, event.start.hour + event.start.minute / 60.0))
                 time_y = y + int((event_hour - start_hour) * pixels_per_hour)
@@ -260,7 +430,7 @@ class WeekRenderer(BaseRenderer):
             text_lines = self.wrap_text(
                 event_text,
                 width - 6,
-                self.fonts[font_key],
+                font,
                 draw,
                 max_lines=max_text_lines
             )
@@ -270,20 +440,70 @@ class WeekRenderer(BaseRenderer):
             if event_y + bar_height > y + height:
                 break
 
-            # Draw colored bar with black border for light colors
-            outline_color = self.black if self.is_light_color(event.color) else None
-            outline_width = 1 if outline_color else 0
-            self.draw_box(draw, x, event_y, width, bar_height, 
-                         fill=event.color, outline=outline_color, outline_width=outline_width)
-
-            text_y = event_y + 2
-            for line in text_lines:
-                self.draw_text(draw, line, x + 3, text_y, self.fonts[font_key], self.white)
-                text_y += line_height
+            if image.mode == 'RGB':
+                # Recurring events reuse the same bar, so paste a prerendered one
+                sprite = self._get_event_sprite(event.color, text_lines, font, line_spacing,
+                                                width, bar_height)
+                image.paste(sprite, (x, event_y))
+            else:
+                # RGB sprites would be re-quantized onto a palette canvas
+                self._draw_event_bar(draw, x, event_y, width, bar_height, event.color,
+                                     text_lines, font, line_spacing)
 
             current_y = event_y + bar_height + 2
 
         # Show "+X more" if there are overflow events
-        overflow_count = max(0, len(filtered_events) - max_events)
+        overflow_count = len(filtered_events) - len(events_to_show)
         if overflow_count > 0 and current_y + 15 <= y + height:
             self.draw_text(draw, f"+{overflow_count} more", x, current_y, self.fonts['small'], self.black)
+
+    def _draw_event_bar(self, draw, x, y, width, bar_height, color, text_lines, font, line_spacing):
+        """
+        Draw an event bar and its wrapped title.
+
+        Args:
+            draw: ImageDraw object
+            x: X coordinate
+            y: Y coordinate
+            width: Bar width
+            bar_height: Bar height
+            color: Event RGB color
+            text_lines: Wrapped title lines
+            font: Font object
+            line_spacing: Extra spacing between lines for multiline_text
+        """
+        # Draw colored bar with black border for light colors
+        outline_color = self.black if self.is_light_color(color) else None
+        outline_width = 1 if outline_color else 0
+        self.draw_box(draw, x, y, width, bar_height,
+                      fill=color, outline=outline_color, outline_width=outline_width)
+
+        # One multiline draw lays out every wrapped line at line_height pitch
+        draw.multiline_text((x + 3, y + 2), "\n".join(text_lines),
+                            font=font, fill=self.white, spacing=line_spacing)
+
+    def _get_event_sprite(self, color, text_lines, font, line_spacing, width, bar_height):
+        """
+        Get a prerendered event bar, building it on first use.
+
+        Args:
+            color: Event RGB color
+            text_lines: Wrapped title lines
+            font: Font object
+            line_spacing: Extra spacing between lines for multiline_text
+            width: Bar width
+            bar_height: Bar height
+
+        Returns:
+            PIL.Image: RGB sprite covering the bar's (width + 1) x (bar_height + 1) pixels
+        """
+        key = (color, tuple(text_lines), font, line_spacing, width, bar_height)
+        sprite = self._event_sprites.get(key)
+        if sprite is None:
+            if len(self._event_sprites) >= self.EVENT_SPRITE_LIMIT:
+                self._event_sprites.clear()
+            sprite = Image.new('RGB', (width + 1, bar_height + 1), self.white)
+            self._draw_event_bar(ImageDraw.Draw(sprite), 0, 0, width, bar_height, color,
+                                 text_lines, font, line_spacing)
+            self._event_sprites[key] = sprite
+        return sprite
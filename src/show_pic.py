@@ -6,7 +6,7 @@ import sys
 import random
 import time
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageOps
 import yaml
 
 # Add src to path for imports
@@ -15,6 +15,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 from utils.logger import setup_logger, get_logger
 from display.epaper_driver import EPaperDisplay
 
+# Picture extensions picked up from img/ (matched case-sensitively, like glob)
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif'})
+
 
 def load_config():
     """Load configuration from YAML file."""
@@ -40,9 +43,12 @@ def get_random_image():
     if not img_dir.exists():
         return None
     
-    # Get all image files
-    image_files = list(img_dir.glob('*.jpg')) + list(img_dir.glob('*.jpeg')) + \
-                  list(img_dir.glob('*.png')) + list(img_dir.glob('*.gif'))
+    # Get all image files in a single directory pass
+    with os.scandir(img_dir) as entries:
+        image_files = [
+            Path(entry.path) for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1] in IMAGE_EXTENSIONS
+        ]
     
     if not image_files:
         return None
@@ -77,27 +83,15 @@ def display_picture():
         height = display_config['height']
         
         logger.info(f"Loading image and resizing to {width}x{height}...")
-        image = Image.open(image_path)
-        
-        # Resize maintaining aspect ratio, then crop to fit
-        img_ratio = image.width / image.height
-        display_ratio = width / height
-        
-        if img_ratio > display_ratio:
-            # Image is wider - fit to height and crop width
-            new_height = height
-            new_width = int(height * img_ratio)
-        else:
-            # Image is taller - fit to width and crop height
-            new_width = width
-            new_height = int(width / img_ratio)
-        
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        # Crop to center
-        left = (new_width - width) // 2
-        top = (new_height - height) // 2
-        image = image.crop((left, top, left + width, top + height))
+        with Image.open(image_path) as source:
+            # Let libjpeg decode at a reduced scale (1/2, 1/4, 1/8) when the
+            # source is much larger than the display; keep 2x headroom for quality
+            if source.format == 'JPEG':
+                source.draft('RGB', (width * 2, height * 2))
+
+            # Resize maintaining aspect ratio and crop to center in one pass;
+            # the result is in memory, so the source file closes right after
+            image = ImageOps.fit(source, (width, height), Image.Resampling.LANCZOS)
         
         # Convert to RGB if needed
         if image.mode != 'RGB':
@@ -1,5 +1,7 @@
 """Color management for e-paper display and calendar color assignment."""
 
+from functools import lru_cache
+
 
 class ColorManager:
     """
@@ -23,6 +25,10 @@ class ColorManager:
         'blue': (0, 0, 255)
     }
 
+    # Palette as (rgb, is_achromatic) pairs for nearest-color searches
+    _PALETTE = tuple(
+        (rgb, name in ('white', 'black')) for name, rgb in EPAPER_COLORS.items()
+    )
     # Common color names mapped to RGB (will be quantized to nearest e-paper color)
     COMMON_COLORS = {
         # Basic colors
@@ -240,27 +246,35 @@ class ColorManager:
         Returns:
             tuple: Nearest e-paper color RGB tuple
         """
+        return self._nearest_color(tuple(rgb))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _nearest_color(rgb):
+        """Cached nearest-color search behind quantize_to_palette."""
         r, g, b = rgb
+
+        # Saturation of the input only depends on rgb, so compute it once
+        avg = (r + g + b) / 3
+        saturation = max(abs(r - avg), abs(g - avg), abs(b - avg))
+        # Penalize white/black for chromatic inputs so colors like pink, cyan
+        # and magenta map to their nearest chromatic color rather than white.
+        # Distances are compared squared, so the 1.5x penalty becomes 2.25x.
+        achromatic_penalty = 2.25 if saturation > 50 else 1.0
+
         min_distance = float('inf')
-        nearest_color = self.EPAPER_COLORS['black']
+        nearest_color = ColorManager.EPAPER_COLORS['black']
 
-        for color_name, color_rgb in self.EPAPER_COLORS.items():
+        for color_rgb, is_achromatic in ColorManager._PALETTE:
             cr, cg, cb = color_rgb
-            
-            # Calculate Euclidean distance in RGB space
-            distance = ((r - cr) ** 2 + (g - cg) ** 2 + (b - cb) ** 2) ** 0.5
-            
-            # Apply penalty for white/black to prefer chromatic colors
-            # This helps colors like pink, cyan, magenta map to their nearest chromatic color
-            # rather than white
-            if color_name in ['white', 'black']:
-                # Calculate saturation of input color (how far from grayscale)
-                avg = (r + g + b) / 3
-                saturation = max(abs(r - avg), abs(g - avg), abs(b - avg))
-                
-                # If input color is highly saturated, penalize achromatic colors
-                if saturation > 50:  # Threshold for considering a color "chromatic"
-                    distance *= 1.5  # Penalty factor
+            dr = r - cr
+            dg = g - cg
+            db = b - cb
+
+            # Squared Euclidean distance in RGB space (same ordering as sqrt)
+            distance = dr * dr + dg * dg + db * db
+            if is_achromatic:
+                distance *= achromatic_penalty
 
             if distance < min_distance:
                 min_distance = distance
@@ -1,33 +1,42 @@
 """Logging configuration for HA-Calendar."""
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+# Queue feeding the background listener, and the one handler the app logger
+# uses; both live for the whole process so records are never dropped
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
 
-def setup_logger(config):
-    """
-    Set up logging with file and console handlers.
+# Background listener that owns the console/file handlers, and the
+# (file, max_bytes, backup_count) those handlers were built for
+_listener = None
+_listener_settings = None
 
-    Args:
-        config: Configuration dictionary with logging settings
 
-    Returns:
-        logging.Logger: Configured logger instance
-    """
-    log_config = config.get('logging', {})
-    log_level = getattr(logging, log_config.get('level', 'INFO'))
-    log_file = log_config.get('file', 'logs/calendar.log')
-    max_bytes = log_config.get('max_bytes', 1048576)  # 1MB default
-    backup_count = log_config.get('backup_count', 3)
+def _stop_listener():
+    """Flush queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
-    # Create logger
-    logger = logging.getLogger('ha_calendar')
-    logger.setLevel(log_level)
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+atexit.register(_stop_listener)
+
+
+def _create_handlers(log_level, log_file, max_bytes, backup_count):
+    """
+    Create the console and rotating file handlers.
 
+    Returns:
+        tuple: (list of handlers, exception raised setting up the file or None)
+    """
     # Create formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -38,7 +47,7 @@ def setup_logger(config):
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (rotating)
     try:
@@ -54,9 +63,61 @@ def setup_logger(config):
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
-        logger.warning(f"Failed to set up file logging: {e}")
+        return handlers, e
+
+    return handlers, None
+
+
+def setup_logger(config):
+    """
+    Set up logging with file and console handlers.
+
+    Args:
+        config: Configuration dictionary with logging settings
+
+    Returns:
+        logging.Logger: Configured logger instance
+
+    Records are handed to a queue and written by a background thread, so
+    callers never block on console or file I/O. Safe to call repeatedly, as
+    the webhook server does for every in-process update: the running listener
+    is kept and only levels are updated unless the log file settings change.
+    """
+    global _listener, _listener_settings
+    log_config = config.get('logging', {})
+    log_level = getattr(logging, log_config.get('level', 'INFO'))
+    log_file = log_config.get('file', 'logs/calendar.log')
+    max_bytes = log_config.get('max_bytes', 1048576)  # 1MB default
+    backup_count = log_config.get('backup_count', 3)
+
+    # Create logger
+    logger = logging.getLogger('ha_calendar')
+    logger.setLevel(log_level)
+
+    # Route through the queue only; swapping the list in one assignment
+    # leaves no moment where the logger has no handler
+    if logger.handlers != [_queue_handler]:
+        logger.handlers = [_queue_handler]
+
+    settings = (log_file, max_bytes, backup_count)
+    if _listener is not None and settings == _listener_settings:
+        for handler in _listener.handlers:
+            handler.setLevel(log_level)
+        return logger
+
+    handlers, file_error = _create_handlers(log_level, log_file, max_bytes, backup_count)
+
+    # The old listener drains what is queued; anything logged meanwhile waits
+    # in the shared queue for the new one
+    _stop_listener()
+    _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _listener_settings = settings
+
+    if file_error:
+        logger.warning(f"Failed to set up file logging: {file_error}")
 
     return logger
 
@@ -2,6 +2,8 @@
 
 import json
 import os
+import tempfile
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
 from utils.logger import get_logger
@@ -11,33 +13,69 @@ logger = get_logger()
 # State file location - in the project root
 STATE_FILE = Path(__file__).parent.parent.parent / 'state.json'
 
+# Fields callers usually need together, read from one load_state() call
+State = namedtuple('State', ['last_updated', 'current_view'])
 
-def save_state(last_updated=None, current_view=None):
+# (file signature, state) of the last state read or written; replaced as a
+# whole so a reader in another thread never pairs a signature with the
+# wrong state
+_cache = (None, None)
+
+
+def _file_signature(stat_result):
+    """
+    Identify a version of the state file by mtime, size and inode.
+
+    Every save replaces the file, so the inode changes even when two writes
+    of the same size land within one mtime tick.
+    """
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+
+def save_state(last_updated=None, current_view=None, inputs_hash=None):
     """
     Save display state to file.
 
     Args:
         last_updated: ISO format timestamp string or None to use current time
         current_view: Current view name (two_week, month, week, agenda, four_day)
+        inputs_hash: Hash of the data the display was rendered from, or None
 
     Returns:
         dict: The saved state
     """
+    global _cache
     try:
-        if last_updated is None:
-            last_updated = datetime.now().isoformat()
-
+        now = datetime.now().isoformat()
         state = {
-            'last_updated': last_updated,
+            'last_updated': now if last_updated is None else last_updated,
             'current_view': current_view,
-            'state_updated': datetime.now().isoformat()
+            'state_updated': now
         }
+        if inputs_hash is not None:
+            state['inputs_hash'] = inputs_hash
 
         # Ensure parent directory exists
         STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        # Write to a temp file and rename so readers never see a partial file;
+        # the display service and the webhook both save state, so each write
+        # gets its own temp file
+        fd, tmp_file = tempfile.mkstemp(dir=STATE_FILE.parent, prefix='state.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                # mkstemp creates the file owner-only; both services read the state
+                os.chmod(tmp_file, 0o644)
+                json.dump(state, f, separators=(',', ':'))
+                f.flush()
+                # The rename keeps the inode, so this is the saved file's signature
+                signature = _file_signature(os.fstat(f.fileno()))
+            os.replace(tmp_file, STATE_FILE)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
+        _cache = (signature, state)
 
         logger.debug(f"State saved: {state}")
         return state
@@ -53,21 +91,55 @@ def load_state():
     Returns:
         dict: State dictionary with keys 'last_updated' and 'current_view', or None if file doesn't exist
     """
+    global _cache
     try:
-        if not STATE_FILE.exists():
+        try:
+            signature = _file_signature(STATE_FILE.stat())
+        except FileNotFoundError:
             logger.debug(f"State file not found at {STATE_FILE}")
             return None
 
+        # Reuse the parsed state until another process rewrites the file
+        cached_signature, cached_state = _cache
+        if signature == cached_signature:
+            return dict(cached_state)
+
         with open(STATE_FILE, 'r') as f:
             state = json.load(f)
 
+        _cache = (signature, state)
         logger.debug(f"State loaded: {state}")
-        return state
+        return dict(state)
     except Exception as e:
         logger.error(f"Failed to load state: {e}")
         return None
 
 
+def clear_inputs_hash():
+    """
+    Forget the rendered-inputs hash so the next update redraws the display.
+
+    Call this whenever something other than a calendar render (a picture, the
+    offline or error screen) is put on the panel.
+    """
+    state = load_state()
+    if state and state.get('inputs_hash'):
+        save_state(last_updated=state.get('last_updated'), current_view=state.get('current_view'))
+
+
+def get_state():
+    """
+    Get the last update timestamp and current view with a single state read.
+
+    Returns:
+        State: (last_updated, current_view); fields are None if no state is saved
+    """
+    state = load_state()
+    if not state:
+        return State(None, None)
+    return State(state.get('last_updated'), state.get('current_view'))
+
+
 def get_last_updated():
     """
     Get the last update timestamp.
@@ -75,8 +147,7 @@ def get_last_updated():
     Returns:
         str: ISO format timestamp or None
     """
-    state = load_state()
-    return state.get('last_updated') if state else None
+    return get_state().last_updated
 
 
 def get_current_view():
@@ -86,5 +157,4 @@ def get_current_view():
     Returns:
         str: View name or None
     """
-    state = load_state()
-    return state.get('current_view') if state else None
+    return get_state().current_view
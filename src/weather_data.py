@@ -1,12 +1,41 @@
 """Weather data processing from Home Assistant."""
 
+import logging
+import sys
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import date
+from operator import attrgetter
+from typing import Dict, Optional
 from utils.logger import get_logger
 
-
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep plain ones
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Entity attributes that may carry the forecast, in order of preference
+FORECAST_ATTRIBUTE_KEYS = ('forecast', 'forecasts', 'daily_forecast', 'hourly_forecast')
+_FORECAST_ATTRIBUTE_KEY_SET = frozenset(FORECAST_ATTRIBUTE_KEYS)
+
+# Compass point names reported as wind_bearing, mapped to degrees
+CARDINAL_BEARINGS = {
+    'N': 0.0,
+    'NE': 45.0,
+    'E': 90.0,
+    'SE': 135.0,
+    'S': 180.0,
+    'SW': 225.0,
+    'W': 270.0,
+    'NW': 315.0,
+}
+
+# WeatherInfo fields read together by the formatters, fetched in one call
+_TEMP_FIELDS = attrgetter('condition', 'temperature', 'temperature_unit')
+_DETAILED_FIELDS = attrgetter(
+    'condition', 'temperature', 'temperature_unit',
+    'humidity', 'wind_speed', 'wind_speed_unit'
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DayForecast:
     """Represents weather forecast for a single day."""
     date: str  # ISO format date YYYY-MM-DD
@@ -16,7 +45,7 @@ class DayForecast:
     temperature_low: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WeatherInfo:
     """Represents weather information for display."""
     condition: str
@@ -26,7 +55,7 @@ class WeatherInfo:
     wind_speed: float
     wind_speed_unit: str
     wind_bearing: Optional[float] = None
-    forecast: dict = None  # Maps date string (YYYY-MM-DD) to DayForecast
+    forecast: Optional[Dict[str, DayForecast]] = None  # Maps date string (YYYY-MM-DD) to DayForecast
 
 
 class WeatherDataProcessor:
@@ -68,6 +97,11 @@ class WeatherDataProcessor:
         'exceptional': '\uf03b',      # Tornado/exceptional
     }
 
+    # (icon, color) per condition so the pair comes from a single lookup;
+    # filled in after the class body, which can't see the tables above
+    ICON_COLORS = {}
+    DEFAULT_ICON_COLOR = ('\uf03b', 'black')  # Exceptional icon in black
+
     def __init__(self):
         """Initialize weather data processor."""
         self.logger = get_logger()
@@ -101,17 +135,7 @@ class WeatherDataProcessor:
             if wind_bearing is None:
                 wind_bearing = attributes.get('wind_direction')
             if isinstance(wind_bearing, str):
-                cardinal_map = {
-                    'N': 0.0,
-                    'NE': 45.0,
-                    'E': 90.0,
-                    'SE': 135.0,
-                    'S': 180.0,
-                    'SW': 225.0,
-                    'W': 270.0,
-                    'NW': 315.0,
-                }
-                wind_bearing = cardinal_map.get(wind_bearing.strip().upper())
+                wind_bearing = CARDINAL_BEARINGS.get(wind_bearing.strip().upper())
             try:
                 wind_bearing = float(wind_bearing) if wind_bearing is not None else None
             except (TypeError, ValueError):
@@ -119,6 +143,8 @@ class WeatherDataProcessor:
 
             # Extract and parse forecast data
             forecast_dict = {}
+            # Checked once so per-item debug messages are not even formatted when off
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
             
             # First try forecast service data (preferred - has multi-day forecasts)
             if forecast_service_data:
@@ -147,63 +173,67 @@ class WeatherDataProcessor:
                         self.logger.debug(f"  Entity is direct array with {len(forecasts_list)} items")
                     
                     if forecasts_list:
-                        for i, forecast_item in enumerate(forecasts_list):
-                            if not isinstance(forecast_item, dict):
-                                self.logger.warning(f"Forecast item {i} is not a dict: {type(forecast_item)}")
-                                continue
-                            
+                        forecast_items = [item for item in forecasts_list if isinstance(item, dict)]
+                        skipped = len(forecasts_list) - len(forecast_items)
+                        if skipped:
+                            self.logger.warning(f"Skipped {skipped} forecast items that are not dicts")
+
+                        for i, forecast_item in enumerate(forecast_items):
                             # Service returns datetime key
                             date_str = forecast_item.get('datetime', '')
                             if date_str:
                                 # Extract just the date part (YYYY-MM-DD)
-                                date_key = date_str.split('T')[0] if 'T' in date_str else date_str
+                                date_key = date_str[:10]
                                 
+                                get = forecast_item.get
                                 day_forecast = DayForecast(
-                                    date=date_key,
-                                    condition=forecast_item.get('condition', 'unknown'),
-                                    temperature=forecast_item.get('temperature', 0),
-                                    wind_speed=forecast_item.get('wind_speed', 0),
-                                    temperature_low=forecast_item.get('templow')
+                                    date_key,
+                                    get('condition', 'unknown'),
+                                    get('temperature', 0),
+                                    get('wind_speed', 0),
+                                    get('templow')
                                 )
                                 forecast_dict[date_key] = day_forecast
-                                if i < 5:
+                                if debug_enabled and i < 5:
                                     self.logger.debug(f"  Forecast {i}: {date_key} -> {day_forecast.condition} ({day_forecast.temperature}°)")
             
-            # If no forecast from service, try entity attributes
-            if not forecast_dict:
+            # If no forecast from service, try entity attributes (when any are present)
+            if not forecast_dict and not _FORECAST_ATTRIBUTE_KEY_SET.isdisjoint(attributes):
                 self.logger.debug("No forecast from service, trying entity attributes")
                 
                 # Try multiple possible attribute names
-                forecast_data = attributes.get('forecast', [])
-                if not forecast_data:
-                    forecast_data = attributes.get('forecasts', [])
-                if not forecast_data:
-                    forecast_data = attributes.get('daily_forecast', [])
-                if not forecast_data:
-                    forecast_data = attributes.get('hourly_forecast', [])
+                forecast_data = next(
+                    (attributes[key] for key in FORECAST_ATTRIBUTE_KEYS if attributes.get(key)),
+                    []
+                )
                 
                 self.logger.debug(f"Raw forecast data type: {type(forecast_data)}, length: {len(forecast_data) if forecast_data else 0}")
                 
                 if forecast_data:
-                    for i, forecast_item in enumerate(forecast_data):
+                    forecast_items = [item for item in forecast_data if isinstance(item, dict)]
+                    for i, forecast_item in enumerate(forecast_items):
                         # Handle both date and datetime keys
                         date_str = forecast_item.get('date') or forecast_item.get('datetime')
                         if date_str:
+                            if not isinstance(date_str, str):
+                                date_str = str(date_str)
                             # Extract just the date part (YYYY-MM-DD)
-                            date_key = date_str.split('T')[0] if 'T' in str(date_str) else str(date_str)
+                            date_key = date_str[:10]
                             
+                            get = forecast_item.get
                             day_forecast = DayForecast(
-                                date=date_key,
-                                condition=forecast_item.get('condition', 'unknown'),
-                                temperature=forecast_item.get('temperature', 0),
-                                wind_speed=forecast_item.get('wind_speed', 0),
-                                temperature_low=forecast_item.get('templow')
+                                date_key,
+                                get('condition', 'unknown'),
+                                get('temperature', 0),
+                                get('wind_speed', 0),
+                                get('templow')
                             )
                             forecast_dict[date_key] = day_forecast
-                            self.logger.debug(f"Forecast {i}: {date_key} -> {day_forecast.condition}")
+                            if debug_enabled:
+                                self.logger.debug(f"Forecast {i}: {date_key} -> {day_forecast.condition}")
 
             # Also add today's weather to forecast if not already there (fallback)
-            today_key = datetime.now().date().isoformat()
+            today_key = date.today().isoformat()
             if today_key not in forecast_dict:
                 today_forecast = DayForecast(
                     date=today_key,
@@ -249,11 +279,13 @@ class WeatherDataProcessor:
         if not weather_info:
             return "Weather Unavailable"
 
+        condition, temperature, temperature_unit = _TEMP_FIELDS(weather_info)
+
         # Format temperature with degree symbol
-        temp_str = f"{weather_info.temperature:.0f}{weather_info.temperature_unit}"
+        temp_str = f"{temperature:.0f}{temperature_unit}"
 
         # Combine condition and temperature
-        return f"{weather_info.condition}, {temp_str}"
+        return f"{condition}, {temp_str}"
 
     def format_weather_detailed(self, weather_info):
         """
@@ -273,11 +305,13 @@ class WeatherDataProcessor:
                 'wind': '---'
             }
 
+        (condition, temperature, temperature_unit,
+         humidity, wind_speed, wind_speed_unit) = _DETAILED_FIELDS(weather_info)
         return {
-            'condition': weather_info.condition,
-            'temperature': f"{weather_info.temperature:.0f}{weather_info.temperature_unit}",
-            'humidity': f"{weather_info.humidity}%",
-            'wind': f"{weather_info.wind_speed:.0f} {weather_info.wind_speed_unit}"
+            'condition': condition,
+            'temperature': f"{temperature:.0f}{temperature_unit}",
+            'humidity': f"{humidity}%",
+            'wind': f"{wind_speed:.0f} {wind_speed_unit}"
         }
 
     def get_weather_icon(self, condition):
@@ -297,9 +331,7 @@ class WeatherDataProcessor:
     def get_weather_icon_with_color(self, condition):
         """Returns (icon_char, color_name) for the given weather condition."""
         condition_key = condition.lower() if condition else None
-        icon = self.WEATHER_ICONS.get(condition_key, '\uf03b')
-        color = self.WEATHER_COLORS.get(condition_key, 'black')
-        return icon, color
+        return self.ICON_COLORS.get(condition_key, self.DEFAULT_ICON_COLOR)
 
     def format_weather_with_icon(self, weather_info):
         """
@@ -314,6 +346,13 @@ class WeatherDataProcessor:
         if not weather_info:
             return "N/A"
 
-        icon = self.get_weather_icon(weather_info.condition.lower())
-        temp_str = f"{weather_info.temperature:.0f}{weather_info.temperature_unit}"
+        condition, temperature, temperature_unit = _TEMP_FIELDS(weather_info)
+        icon = self.get_weather_icon(condition.lower())
+        temp_str = f"{temperature:.0f}{temperature_unit}"
         return f"{icon} {temp_str}"
+
+
+WeatherDataProcessor.ICON_COLORS = {
+    condition: (icon, WeatherDataProcessor.WEATHER_COLORS.get(condition, 'black'))
+    for condition, icon in WeatherDataProcessor.WEATHER_ICONS.items()
+}
@@ -3,16 +3,23 @@
 
 import json
 import os
-import subprocess
 import sys
 import shutil
 import re
-from datetime import datetime
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from utils.logger import get_logger
-from utils.state_manager import load_state
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils.logger import get_logger, setup_logger
+from utils.state_manager import clear_inputs_hash, load_state
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
 # Get the calendar script path from environment variable
@@ -21,18 +28,65 @@ CALENDAR_SCRIPT_PATH = os.environ.get(
     os.path.join(os.path.dirname(__file__), 'main.py')
 )
 
-# Get the picture display script path
-PICTURE_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), 'show_pic.py')
-
 # Get deployment directory
 DEPLOYMENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_PATH = os.path.join(DEPLOYMENT_DIR, 'config', 'config.yaml')
 DISPLAY_PATH = os.path.join(DEPLOYMENT_DIR, 'calendar_display.png')
 IMG_DIR = os.path.join(DEPLOYMENT_DIR, 'img')
 
-# Get venv python path
-VENV_PYTHON = os.path.join(DEPLOYMENT_DIR, 'venv', 'bin', 'python3')
+# Import the calendar and picture scripts once so each run skips interpreter startup
+sys.path.insert(0, os.path.dirname(os.path.abspath(CALENDAR_SCRIPT_PATH)))
+import main as calendar_main  # noqa: E402
+import show_pic  # noqa: E402
+
+# Same lock file the display service takes around each update
+LOCK_FILE = os.path.join(tempfile.gettempdir(), 'ha-calendar.lock')
+CALENDAR_UPDATE_TIMEOUT = 120  # seconds
+PICTURE_DISPLAY_TIMEOUT = 60  # seconds, allows for slow e-paper refresh
+
+# Single worker so in-process display jobs (calendar or picture) never overlap
+_update_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='calendar-update')
+
+# Reused threads for work that outlives the request, such as /pics
+_background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='background')
+
+# Last /health body and when it stops being reused
+HEALTH_TTL = 1.0  # seconds
+_health_cache = {'expires': 0.0, 'body': None}
+
+# Calendar update that is queued or running; concurrent refreshes share it
+_refresh_future = None
+_refresh_lock = threading.Lock()
+
+# Token bucket for webhook-triggered updates: a burst of REFRESH_BURST, then one
+# more every REFRESH_INTERVAL seconds; guarded by _refresh_lock
+REFRESH_BURST = 2
+REFRESH_INTERVAL = 60.0  # seconds per token
+_refresh_bucket = {'tokens': float(REFRESH_BURST), 'updated': time.monotonic()}
+
+
+# Upload parsing patterns, compiled once; part headers are matched as bytes
+_BOUNDARY_RE = re.compile(r'boundary=([^;]+)')
+_NAME_RE = re.compile(rb'\bname="([^"]*)"')
+_FILENAME_RE = re.compile(rb'filename="([^"]*)"')
 
+# Uploads are limited to the picture types show_pic displays
+ALLOWED_EXTENSIONS = show_pic.IMAGE_EXTENSIONS
+_ALLOWED_EXTENSIONS_SUFFIX = f' not allowed. Use: {", ".join(sorted(ALLOWED_EXTENSIONS))}'.encode()
+
+# Fixed response bodies, encoded once
+RESPONSE_REFRESH_OK = b'Calendar refresh triggered successfully'
+RESPONSE_REFRESH_UNCHANGED = b'Calendar unchanged, display not redrawn'
+RESPONSE_REFRESH_BUSY = b'Error: Another calendar update is already running'
+RESPONSE_REFRESH_FAILED = b'Error: Calendar update failed, check the calendar log'
+RESPONSE_REFRESH_TIMEOUT = b'Error: Calendar update timed out'
+RESPONSE_REFRESH_RATE_LIMITED = b'Error: Too many refresh requests, try again later'
+RESPONSE_HA_UNREACHABLE = b'Error: Home Assistant unreachable'
+RESPONSE_PICS_STARTED = b'Picture display started! Will show for 15 seconds then restore calendar.'
+RESPONSE_NOT_MULTIPART = b'Error: Content-Type must be multipart/form-data'
+RESPONSE_NO_BOUNDARY = b'Error: No boundary in Content-Type'
+RESPONSE_NO_FILE_FIELD = b'Error: No file field in upload'
+RESPONSE_NO_FILE_SELECTED = b'Error: No file selected'
 
 def get_config():
     """Load the current configuration."""
@@ -47,301 +101,581 @@ def get_config():
         return None
 
 
-def parse_multipart_form(data, boundary):
+def dumps_json(data):
+    """Serialize a response payload to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def get_health_body():
+    """
+    Build the /health JSON body from the saved display state.
+
+    The body is reused for HEALTH_TTL seconds, so frequent monitor probes read
+    the state file at most once per interval.
+
+    Returns:
+        bytes: Serialized health payload
+    """
+    now = time.monotonic()
+    if now < _health_cache['expires']:
+        return _health_cache['body']
+
+    # Load state from file
+    state = load_state()
+
+    if state:
+        health_data = {
+            'status': 'ok',
+            'last_updated': state.get('last_updated'),
+            'current_view': state.get('current_view'),
+            'state_updated': state.get('state_updated')
+        }
+    else:
+        # No state file yet (first run)
+        health_data = {
+            'status': 'no_state',
+            'message': 'Display has not been updated yet',
+            'last_updated': None,
+            'current_view': None
+        }
+
+    body = dumps_json(health_data)
+    _health_cache['body'] = body
+    _health_cache['expires'] = now + HEALTH_TTL
+    return body
+
+
+def _update_calendar():
+    """
+    Run one calendar update cycle in this process.
+
+    Returns:
+        tuple: (HTTP status code, response body bytes)
+    """
+    try:
+        lock_fd = calendar_main._acquire_lock(LOCK_FILE)
+    except OSError:
+        return 409, RESPONSE_REFRESH_BUSY
+
+    try:
+        # An update that skips the redraw leaves the saved timestamp as it was
+        last_updated = (load_state() or {}).get('last_updated')
+        # Webhook bursts often carry no new data; skip redrawing identical content
+        result = calendar_main.main(skip_unchanged=True)
+    except SystemExit:
+        # load_config() exits when config.yaml is missing or unreadable
+        result = None
+    finally:
+        calendar_main._release_lock(lock_fd)
+        # The update rewrote the state file; don't serve the old snapshot
+        _health_cache['expires'] = 0.0
+
+    if result is True:
+        if last_updated and (load_state() or {}).get('last_updated') == last_updated:
+            return 200, RESPONSE_REFRESH_UNCHANGED
+        return 200, RESPONSE_REFRESH_OK
+    if result is False:
+        return 503, RESPONSE_HA_UNREACHABLE
+    return 500, RESPONSE_REFRESH_FAILED
+
+
+def _take_refresh_token():
+    """
+    Take a token from the refresh bucket if one is available.
+
+    Must be called with _refresh_lock held.
+
+    Returns:
+        bool: True if a token was taken
+    """
+    now = time.monotonic()
+    tokens = min(REFRESH_BURST, _refresh_bucket['tokens'] + (now - _refresh_bucket['updated']) / REFRESH_INTERVAL)
+    _refresh_bucket['updated'] = now
+    if tokens < 1:
+        _refresh_bucket['tokens'] = tokens
+        return False
+    _refresh_bucket['tokens'] = tokens - 1
+    return True
+
+
+def run_calendar_update(timeout=CALENDAR_UPDATE_TIMEOUT, rate_limit=False):
     """
-    Parse multipart/form-data without using the deprecated cgi module.
-    
+    Run a calendar update on the update worker and wait for it.
+
+    Callers that arrive while an update is already queued or running wait on
+    that update instead of starting another, so a burst of webhooks renders once.
+
     Args:
-        data: Raw bytes of the form data
-        boundary: Boundary string from Content-Type header
-    
+        timeout: Seconds to wait before giving up on the update
+        rate_limit: Start a new update only if the refresh token bucket allows
+            it; joining an update that is already running is always allowed
+
     Returns:
-        dict: Parsed form fields and files
+        tuple: (HTTP status code, response body bytes)
+
+    Raises:
+        concurrent.futures.TimeoutError: If the update does not finish in time
     """
-    parts = data.split(('--' + boundary).encode())
-    files = {}
-    
-    for part in parts:
-        if not part or part == b'--\r\n' or part == b'--':
-            continue
-            
-        # Split headers from content
-        if b'\r\n\r\n' in part:
-            header_section, content = part.split(b'\r\n\r\n', 1)
+    global _refresh_future
+    with _refresh_lock:
+        if _refresh_future is None or _refresh_future.done():
+            if rate_limit and not _take_refresh_token():
+                return 429, RESPONSE_REFRESH_RATE_LIMITED
+            _refresh_future = _update_executor.submit(_update_calendar)
+        future = _refresh_future
+    return future.result(timeout=timeout)
+
+
+def _show_picture():
+    """
+    Show a random picture in this process.
+
+    Returns:
+        bool: True if the picture was displayed
+    """
+    try:
+        show_pic.display_picture()
+        return True
+    except SystemExit:
+        # show_pic exits on a missing config or a display error
+        return False
+    finally:
+        # The panel no longer shows the calendar, so the next update must redraw it
+        clear_inputs_hash()
+
+
+def run_picture_display(timeout=PICTURE_DISPLAY_TIMEOUT):
+    """
+    Show a random picture on the update worker and wait for it.
+
+    Args:
+        timeout: Seconds to wait before giving up on the picture
+
+    Returns:
+        bool: True if the picture was displayed
+
+    Raises:
+        concurrent.futures.TimeoutError: If the picture does not finish in time
+    """
+    return _update_executor.submit(_show_picture).result(timeout=timeout)
+
+
+def display_and_refresh():
+    """Display picture, wait, then refresh calendar."""
+    try:
+        # Display the picture (includes 15 second wait)
+        if run_picture_display():
+            logger.info("Picture display completed successfully")
         else:
-            continue
-        
-        # Remove trailing \r\n from content
-        content = content.rstrip(b'\r\n')
-        
-        # Parse Content-Disposition header
-        header_section_str = header_section.decode('utf-8', errors='ignore')
-        
-        # Extract filename if present
-        filename_match = re.search(r'filename="([^"]+)"', header_section_str)
-        name_match = re.search(r'name="([^"]+)"', header_section_str)
-        
-        if filename_match and name_match:
-            field_name = name_match.group(1)
-            filename = filename_match.group(1)
-            files[field_name] = {
-                'filename': filename,
-                'content': content
-            }
-    
-    return files
+            logger.error("Picture display failed, see the calendar log")
+
+        # Now refresh the calendar
+        logger.info("Restoring calendar display...")
+        status, message = run_calendar_update()
+
+        if status == 200:
+            logger.info("Calendar restored successfully")
+        else:
+            logger.warning(f"Calendar restore had issues: {message.decode()}")
+    except Exception as e:
+        logger.error(f"Error in display_and_refresh: {e}")
+
+
+def create_upload_file(filename):
+    """
+    Create a new file in the img directory without overwriting an existing one.
+
+    The create is atomic (O_EXCL), so two uploads with the same name can't
+    both claim it. A taken name gets a timestamp suffix, then a counter.
+
+    Args:
+        filename: Requested file name (already stripped of directories)
+
+    Returns:
+        tuple: (binary file object open for writing, file name actually used)
+    """
+    name, ext = os.path.splitext(filename)
+    suffix = None
+    attempt = 0
+    while True:
+        try:
+            fd = os.open(os.path.join(IMG_DIR, filename), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            return os.fdopen(fd, 'wb'), filename
+        except FileExistsError:
+            attempt += 1
+            if suffix is None:
+                # Add timestamp to make unique
+                suffix = time.strftime('%Y%m%d_%H%M%S')
+                filename = f"{name}_{suffix}{ext}"
+            else:
+                filename = f"{name}_{suffix}_{attempt}{ext}"
+
+
+class MultipartReader:
+    """
+    Read multipart/form-data parts from a request stream one chunk at a time.
+
+    Only one chunk plus a boundary's worth of bytes is held in memory, so large
+    uploads go straight to disk instead of being buffered whole.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    MAX_HEADER_SIZE = 16 * 1024
+
+    def __init__(self, stream, content_length, boundary):
+        """
+        Args:
+            stream: File-like object positioned at the start of the body
+            content_length: Number of body bytes to read from the stream
+            boundary: Boundary string from Content-Type header
+        """
+        self.stream = stream
+        self.remaining = content_length
+        # Every delimiter, including the first, is preceded by a line break
+        self.delimiter = b'\r\n--' + boundary.encode()
+        self.buffer = bytearray(b'\r\n')
+        self.started = False
+
+    def _fill(self):
+        """Append the next chunk of the body to the buffer. Returns False at end."""
+        if self.remaining <= 0:
+            return False
+        chunk = self.stream.read(min(self.CHUNK_SIZE, self.remaining))
+        if not chunk:
+            self.remaining = 0
+            return False
+        self.remaining -= len(chunk)
+        self.buffer += chunk
+        return True
+
+    def _read_until(self, marker, limit):
+        """Return the buffered bytes before marker and drop them, marker included."""
+        while True:
+            index = self.buffer.find(marker)
+            if index >= 0:
+                data = bytes(self.buffer[:index])
+                del self.buffer[:index + len(marker)]
+                return data
+            if len(self.buffer) > limit or not self._fill():
+                raise ValueError("Malformed multipart body")
+
+    def next_part(self):
+        """
+        Advance to the next part and parse its Content-Disposition header.
+
+        Returns:
+            dict: 'name' and 'filename' of the part (None when absent),
+                or None after the closing boundary
+        """
+        if not self.started:
+            self._read_until(self.delimiter, self.MAX_HEADER_SIZE)
+            self.started = True
+
+        while len(self.buffer) < 2:
+            if not self._fill():
+                raise ValueError("Malformed multipart body")
+        if self.buffer.startswith(b'--'):
+            return None
+
+        headers = self._read_until(b'\r\n\r\n', self.MAX_HEADER_SIZE)
+        name_match = _NAME_RE.search(headers)
+        filename_match = _FILENAME_RE.search(headers)
+        return {
+            'name': name_match.group(1).decode('utf-8', errors='ignore') if name_match else None,
+            'filename': filename_match.group(1).decode('utf-8', errors='ignore') if filename_match else None
+        }
+
+    def _write_prefix(self, write, size):
+        """Pass the first size buffered bytes to write without copying them."""
+        # Views must be released before the bytearray can be resized again
+        with memoryview(self.buffer) as view, view[:size] as block:
+            write(block)
+
+    def read_part(self, write=None):
+        """
+        Stream the current part's content up to the next delimiter.
+
+        Args:
+            write: Callable receiving each block of content, or None to discard it
+        """
+        delimiter = self.delimiter
+        # Bytes that might be the start of a delimiter split across chunks
+        keep = len(delimiter) - 1
+        while True:
+            index = self.buffer.find(delimiter)
+            if index >= 0:
+                if write and index:
+                    self._write_prefix(write, index)
+                del self.buffer[:index + len(delimiter)]
+                return
+            safe = len(self.buffer) - keep
+            if safe > 0:
+                if write:
+                    self._write_prefix(write, safe)
+                del self.buffer[:safe]
+            if not self._fill():
+                raise ValueError("Multipart body ended before the closing boundary")
 
 
 class WebhookHandler(BaseHTTPRequestHandler):
     """Handle webhook requests to trigger calendar updates."""
 
-    def do_POST(self):
-        """Handle POST requests to trigger a calendar update."""
-        if self.path == '/refresh':
-            logger.info("Webhook received: Triggering calendar refresh")
+    # HTTP/1.1 lets clients reuse one connection for several webhooks
+    protocol_version = 'HTTP/1.1'
+    # Idle keep-alive connections are dropped after this many seconds
+    timeout = 30
+    # Largest unread request body drained to keep a connection open
+    MAX_DISCARD_SIZE = 64 * 1024
 
-            try:
-                # Use venv Python if available, otherwise system Python
-                python_cmd = VENV_PYTHON if os.path.exists(VENV_PYTHON) else sys.executable
-                
-                # Run the calendar update script (no sudo needed)
-                result = subprocess.run(
-                    [python_cmd, CALENDAR_SCRIPT_PATH],
-                    capture_output=True,
-                    text=True,
-                    timeout=120,
-                    cwd=DEPLOYMENT_DIR
-                )
-
-                if result.returncode == 0:
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(b'Calendar refresh triggered successfully')
-                    logger.info("Calendar refresh completed successfully")
-                    if result.stdout:
-                        logger.debug(f"Output: {result.stdout}")
-                else:
-                    self.send_response(500)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    error_msg = result.stderr or result.stdout or 'Unknown error'
-                    self.wfile.write(f'Error: {error_msg}'.encode())
-                    logger.error(f"Calendar refresh failed (code {result.returncode}): {error_msg}")
-
-            except subprocess.TimeoutExpired:
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'Error: Calendar update timed out')
-                logger.error("Calendar refresh timed out")
-            except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(f'Error: {str(e)}'.encode())
-                logger.error(f"Calendar refresh error: {e}", exc_info=True)
-                
-        elif self.path == '/pics':
-            logger.info("Easter egg triggered: Displaying random picture")
+    # Request paths mapped to the handler method names that serve them
+    POST_ROUTES = {
+        '/refresh': '_handle_refresh',
+        '/pics': '_handle_pics',
+        '/upload': '_handle_upload',
+    }
+    GET_ROUTES = {
+        '/health': '_handle_health',
+    }
+    # POST routes whose handlers read the request body themselves
+    BODY_ROUTES = frozenset({'/upload'})
 
-            try:
-                # Use venv Python if available, otherwise system Python
-                python_cmd = VENV_PYTHON if os.path.exists(VENV_PYTHON) else sys.executable
-                
-                # Start picture display and calendar refresh in background
-                # This prevents timeout issues
-                import threading
-                
-                def display_and_refresh():
-                    """Display picture, wait, then refresh calendar."""
-                    try:
-                        # Display the picture (includes 15 second wait)
-                        result = subprocess.run(
-                            [python_cmd, PICTURE_SCRIPT_PATH],
-                            capture_output=True,
-                            text=True,
-                            timeout=60,  # Increase timeout for slow e-paper refresh
-                            cwd=DEPLOYMENT_DIR
-                        )
-                        
-                        if result.returncode == 0:
-                            logger.info("Picture display completed successfully")
-                        else:
-                            logger.error(f"Picture display failed: {result.stderr}")
-                        
-                        # Now refresh the calendar
-                        logger.info("Restoring calendar display...")
-                        refresh_result = subprocess.run(
-                            [python_cmd, CALENDAR_SCRIPT_PATH],
-                            capture_output=True,
-                            text=True,
-                            timeout=120,
-                            cwd=DEPLOYMENT_DIR
-                        )
-                        
-                        if refresh_result.returncode == 0:
-                            logger.info("Calendar restored successfully")
-                        else:
-                            logger.warning(f"Calendar restore had issues: {refresh_result.stderr}")
-                    except Exception as e:
-                        logger.error(f"Error in display_and_refresh: {e}")
-                
-                # Start the background thread
-                thread = threading.Thread(target=display_and_refresh, daemon=True)
-                thread.start()
-                
-                # Respond immediately
-                self.send_response(202)  # 202 Accepted
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'Picture display started! Will show for 15 seconds then restore calendar.')
-                logger.info("Picture display started in background")
-
-            except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(f'Error: {str(e)}'.encode())
-                logger.error(f"Picture display error: {e}", exc_info=True)
-                
-        elif self.path == '/upload':
-            logger.info("File upload request received")
-            
-            try:
-                # Parse the multipart form data
-                content_type = self.headers.get('Content-Type')
-                
-                if not content_type or not content_type.startswith('multipart/form-data'):
-                    self.send_response(400)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(b'Error: Content-Type must be multipart/form-data')
-                    logger.error("Upload failed: wrong content type")
-                    return
-                
-                # Extract boundary from Content-Type
-                boundary_match = re.search(r'boundary=([^;]+)', content_type)
-                if not boundary_match:
-                    self.send_response(400)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(b'Error: No boundary in Content-Type')
-                    logger.error("Upload failed: no boundary")
-                    return
-                
-                boundary = boundary_match.group(1).strip('"')
-                
-                # Read the request body
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length)
-                
-                # Parse the form data
-                files = parse_multipart_form(body, boundary)
-                
-                # Get the uploaded file
-                if 'file' not in files:
-                    self.send_response(400)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(b'Error: No file field in upload')
-                    logger.error("Upload failed: no file field")
-                    return
-                
-                file_data = files['file']
-                filename = file_data['filename']
-                file_content = file_data['content']
-                
-                if not filename:
-                    self.send_response(400)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(b'Error: No file selected')
-                    logger.error("Upload failed: no file selected")
-                    return
-                
-                # Validate file extension
-                filename = os.path.basename(filename)
-                allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif']
-                file_ext = os.path.splitext(filename)[1].lower()
-                
-                if file_ext not in allowed_extensions:
-                    self.send_response(400)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(f'Error: File type {file_ext} not allowed. Use: {", ".join(allowed_extensions)}'.encode())
-                    logger.error(f"Upload failed: invalid file type {file_ext}")
-                    return
-                
-                # Ensure img directory exists
-                os.makedirs(IMG_DIR, exist_ok=True)
-                
-                # Save the file
-                filepath = os.path.join(IMG_DIR, filename)
-                
-                # Check if file already exists
-                if os.path.exists(filepath):
-                    # Add timestamp to make unique
-                    name, ext = os.path.splitext(filename)
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    filename = f"{name}_{timestamp}{ext}"
-                    filepath = os.path.join(IMG_DIR, filename)
-                
-                with open(filepath, 'wb') as f:
-                    f.write(file_content)
-                
-                logger.info(f"File uploaded successfully: {filename}")
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                response = {
-                    'status': 'success',
-                    'message': f'File uploaded successfully: {filename}',
-                    'filename': filename,
-                    'path': filepath
-                }
-                self.wfile.write(json.dumps(response).encode())
-                
-            except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(f'Error: {str(e)}'.encode())
-                logger.error(f"File upload error: {e}", exc_info=True)
+    # Complete 404 responses, written as-is so scanner and probe traffic skips
+    # per-request header formatting and access logging
+    NOT_FOUND_RESPONSE = (
+        b'HTTP/1.1 404 Not Found\r\n'
+        b'Content-type: text/plain\r\n'
+        b'Content-Length: 0\r\n'
+        b'\r\n'
+    )
+    NOT_FOUND_CLOSE_RESPONSE = (
+        b'HTTP/1.1 404 Not Found\r\n'
+        b'Content-type: text/plain\r\n'
+        b'Content-Length: 0\r\n'
+        b'Connection: close\r\n'
+        b'\r\n'
+    )
+
+    def do_POST(self):
+        """Dispatch POST requests to the matching endpoint handler."""
+        if self.path not in self.BODY_ROUTES:
+            self._discard_body(self._content_length())
+        handler = self.POST_ROUTES.get(self.path)
+        if handler:
+            getattr(self, handler)()
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send_not_found()
 
     def do_GET(self):
-        """Handle GET requests for health checks."""
-        if self.path == '/health':
-            # Load state from file
-            state = load_state()
-            
-            if state:
-                health_data = {
-                    'status': 'ok',
-                    'last_updated': state.get('last_updated'),
-                    'current_view': state.get('current_view'),
-                    'state_updated': state.get('state_updated')
-                }
+        """Dispatch GET requests to the matching endpoint handler."""
+        handler = self.GET_ROUTES.get(self.path)
+        if handler:
+            getattr(self, handler)()
+        else:
+            self._send_not_found()
+
+    def _send_not_found(self):
+        """Reply 404 to a path with no handler."""
+        if self.close_connection:
+            self.wfile.write(self.NOT_FOUND_CLOSE_RESPONSE)
+        else:
+            self.wfile.write(self.NOT_FOUND_RESPONSE)
+
+    def _send_body(self, status, body, content_type='text/plain', headers=()):
+        """
+        Send a complete response with an explicit Content-Length.
+
+        Args:
+            status: HTTP status code
+            body: Response body bytes
+            content_type: Value for the Content-type header
+            headers: Extra (name, value) header pairs
+        """
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reject_upload(self, message, remaining):
+        """
+        Reply 400 to an upload without reading the rest of a large body.
+
+        Args:
+            message: Response body bytes
+            remaining: Number of request body bytes not yet read
+        """
+        if remaining > self.MAX_DISCARD_SIZE:
+            self.close_connection = True
+        self._send_body(400, message)
+
+    def _content_length(self):
+        """Return the request's Content-Length, closing the connection if it is invalid."""
+        try:
+            return max(int(self.headers.get('Content-Length', 0)), 0)
+        except ValueError:
+            self.close_connection = True
+            return 0
+
+    def _discard_body(self, remaining):
+        """
+        Skip an unread request body so the connection can carry another request.
+
+        Args:
+            remaining: Number of body bytes not yet read
+
+        Bodies larger than MAX_DISCARD_SIZE are left unread and the connection
+        is closed instead.
+        """
+        if remaining > self.MAX_DISCARD_SIZE:
+            self.close_connection = True
+        elif remaining > 0:
+            self.rfile.read(remaining)
+
+    def _handle_refresh(self):
+        """Trigger a calendar update and report its result."""
+        logger.info("Webhook received: Triggering calendar refresh")
+
+        try:
+            status, message = run_calendar_update(rate_limit=True)
+
+            # Fingerprint of the data now on the display, so callers can tell
+            # whether a refresh changed anything
+            headers = ()
+            if status == 200:
+                inputs_hash = (load_state() or {}).get('inputs_hash')
+                if inputs_hash:
+                    headers = (('ETag', f'"{inputs_hash}"'),)
+
+            self._send_body(status, message, headers=headers)
+            if message is RESPONSE_REFRESH_UNCHANGED:
+                logger.info("Calendar refresh skipped: display already up to date")
+            elif status == 200:
+                logger.info("Calendar refresh completed successfully")
+            elif status == 429:
+                logger.warning("Calendar refresh rejected: rate limit reached")
             else:
-                # No state file yet (first run)
-                health_data = {
-                    'status': 'no_state',
-                    'message': 'Display has not been updated yet',
-                    'last_updated': None,
-                    'current_view': None
-                }
+                logger.error(f"Calendar refresh failed ({status}): {message.decode()}")
+
+        except FuturesTimeoutError:
+            self._send_body(500, RESPONSE_REFRESH_TIMEOUT)
+            logger.error("Calendar refresh timed out")
+        except Exception as e:
+            self._send_body(500, b'Error: ' + str(e).encode())
+            logger.error(f"Calendar refresh error: {e}", exc_info=True)
+
+    def _handle_pics(self):
+        """Show a random picture, then restore the calendar in the background."""
+        logger.info("Easter egg triggered: Displaying random picture")
+
+        try:
+            # Start picture display and calendar refresh in background
+            # This prevents timeout issues
+            _background_executor.submit(display_and_refresh)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(health_data).encode())
-        else:
-            self.send_response(404)
-            self.end_headers()
+            # Respond immediately
+            self._send_body(202, RESPONSE_PICS_STARTED)  # 202 Accepted
+            logger.info("Picture display started in background")
+
+        except Exception as e:
+            self._send_body(500, b'Error: ' + str(e).encode())
+            logger.error(f"Picture display error: {e}", exc_info=True)
+
+    def _handle_upload(self):
+        """Save an uploaded picture into the img directory."""
+        logger.info("File upload request received")
+        content_length = self._content_length()
+        reader = None
+        
+        try:
+            # Parse the multipart form data
+            content_type = self.headers.get('Content-Type')
+            
+            if not content_type or not content_type.startswith('multipart/form-data'):
+                self._reject_upload(RESPONSE_NOT_MULTIPART, content_length)
+                logger.error("Upload failed: wrong content type")
+                return
+            
+            # Extract boundary from Content-Type
+            boundary_match = _BOUNDARY_RE.search(content_type)
+            if not boundary_match:
+                self._reject_upload(RESPONSE_NO_BOUNDARY, content_length)
+                logger.error("Upload failed: no boundary")
+                return
+            
+            boundary = boundary_match.group(1).strip('"')
+            
+            # Stream the body, skipping parts until the file field
+            reader = MultipartReader(self.rfile, content_length, boundary)
+            part = reader.next_part()
+            while part is not None and part['name'] != 'file':
+                reader.read_part()
+                part = reader.next_part()
+            
+            # Get the uploaded file
+            if part is None:
+                self._reject_upload(RESPONSE_NO_FILE_FIELD, reader.remaining)
+                logger.error("Upload failed: no file field")
+                return
+            
+            filename = part['filename']
+            
+            if not filename:
+                self._reject_upload(RESPONSE_NO_FILE_SELECTED, reader.remaining)
+                logger.error("Upload failed: no file selected")
+                return
+            
+            # Validate file extension before any of the file content is read;
+            # a rejected upload's body is never buffered or drained
+            filename = os.path.basename(filename)
+            file_ext = os.path.splitext(filename)[1].lower()
+            
+            if file_ext not in ALLOWED_EXTENSIONS:
+                message = b'Error: File type ' + file_ext.encode() + _ALLOWED_EXTENSIONS_SUFFIX
+                self._reject_upload(message, reader.remaining)
+                logger.error(f"Upload failed: invalid file type {file_ext}")
+                return
+            
+            # Save the file under a name nobody else holds
+            upload_file, filename = create_upload_file(filename)
+            filepath = os.path.join(IMG_DIR, filename)
+            
+            try:
+                with upload_file as f:
+                    reader.read_part(f.write)
+            except BaseException:
+                # Truncated, stalled or failed upload: don't leave a partial
+                # picture behind for show_pic to pick
+                os.remove(filepath)
+                raise
+            
+            logger.info(f"File uploaded successfully: {filename}")
+            
+            response = {
+                'status': 'success',
+                'message': f'File uploaded successfully: {filename}',
+                'filename': filename,
+                'path': filepath
+            }
+            self._send_body(200, dumps_json(response), 'application/json')
+            
+        except ValueError as e:
+            self._reject_upload(b'Error: ' + str(e).encode(), reader.remaining if reader else content_length)
+            logger.error(f"Upload failed: {e}")
+        except Exception as e:
+            self._send_body(500, b'Error: ' + str(e).encode())
+            logger.error(f"File upload error: {e}", exc_info=True)
+        finally:
+            self._discard_body(reader.remaining if reader else content_length)
+
+    def _handle_health(self):
+        """Report the last display update for health checks."""
+        self._send_body(200, get_health_body(), 'application/json')
 
     def log_message(self, format, *args):
         """Override to use our logger instead of printing."""
@@ -350,8 +684,15 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
 def run_server(port=8765):
     """Run the webhook server."""
+    # Route handler logging through the background queue listener
+    setup_logger(get_config() or {})
+
+    # Uploads are saved here; created once rather than on every upload
+    os.makedirs(IMG_DIR, exist_ok=True)
+
     server_address = ('', port)
-    httpd = HTTPServer(server_address, WebhookHandler)
+    # One thread per request so /health stays responsive while /refresh runs
+    httpd = ThreadingHTTPServer(server_address, WebhookHandler)
     logger.info(f"Starting webhook server on port {port}")
     print(f"Webhook server running on port {port}")
     print(f"Endpoint: http://<raspberry-pi-ip>:{port}/refresh")
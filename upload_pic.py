@@ -2,18 +2,143 @@
 """Upload an image to the HA-Calendar img folder via webhook."""
 
 import argparse
+import io
+import mimetypes
 import requests
 import os
 import sys
+import uuid
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional here; files are then sent unchecked
+    Image = None
 
-def upload_image(server_url, image_path):
+# Picture types the server accepts (same list as show_pic.IMAGE_EXTENSIONS)
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif'})
+
+# Largest size worth sending: twice the 800x480 panel, which is the most detail
+# show_pic uses when it crops and scales a picture to the display
+MAX_UPLOAD_SIZE = (1600, 960)
+
+# Shared session so several uploads reuse one connection to the server;
+# only connection failures are retried, never a POST that reached the server
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+
+class MultipartFileBody:
+    """
+    File-like multipart/form-data body that streams a single file.
+
+    requests sends it with a Content-Length taken from len() and reads it in
+    blocks, so a picture on disk is never loaded into memory as a whole.
+    """
+
+    def __init__(self, field_name, filename, fileobj, content_type):
+        """
+        Args:
+            field_name: Form field name for the file
+            filename: File name reported to the server
+            fileobj: Open binary file or BytesIO positioned at its start
+            content_type: MIME type of the file
+        """
+        boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        quoted_name = filename.replace('"', '%22')
+        head = (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{quoted_name}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode()
+        tail = f'\r\n--{boundary}--\r\n'.encode()
+        size = fileobj.seek(0, io.SEEK_END)
+        fileobj.seek(0)
+        self._length = len(head) + size + len(tail)
+        self._parts = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        """Read up to size bytes of the body (all remaining bytes if size < 0)."""
+        chunks = []
+        while self._parts and size != 0:
+            data = self._parts[0].read(size)
+            if not data:
+                self._parts.pop(0)
+                continue
+            chunks.append(data)
+            if size > 0:
+                size -= len(data)
+        return b''.join(chunks)
+
+
+def prepare_image(image_path, resize=True):
+    """
+    Check that a file is a readable picture and shrink it for the display.
+
+    Corrupt files are caught here instead of after a full upload. JPEG and PNG
+    pictures larger than MAX_UPLOAD_SIZE are scaled down (keeping the aspect
+    ratio, so show_pic still crops the same area) and re-encoded in memory.
+    GIFs are sent as they are so animations survive.
+
+    Args:
+        image_path: Local path to the image file
+        resize: Scale down large pictures before uploading
+
+    Returns:
+        BytesIO: Re-encoded picture, or None to upload the file unchanged
+
+    Raises:
+        ValueError: If the file is not a readable picture
+    """
+    if Image is None:
+        return None
+
+    try:
+        with Image.open(image_path) as im:
+            im.verify()
+        with Image.open(image_path) as im:
+            image_format = im.format
+            width, height = im.size
+            # Scale so the picture still covers MAX_UPLOAD_SIZE on both axes
+            scale = max(MAX_UPLOAD_SIZE[0] / width, MAX_UPLOAD_SIZE[1] / height)
+            if not resize or scale >= 1 or image_format not in ('JPEG', 'PNG'):
+                return None
+
+            new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            if image_format == 'JPEG':
+                im.draft('RGB', new_size)
+            resized = im.resize(new_size, Image.Resampling.LANCZOS)
+    except (OSError, SyntaxError) as e:
+        # Pillow reports broken or unrecognized files as OSError/SyntaxError
+        raise ValueError(f"not a valid image ({e})") from e
+
+    buffer = io.BytesIO()
+    if image_format == 'JPEG':
+        resized.save(buffer, format='JPEG', quality=90)
+    else:
+        resized.save(buffer, format='PNG', optimize=True)
+    buffer.seek(0)
+    print(f"  Resized {width}x{height} to {new_size[0]}x{new_size[1]} for upload")
+    return buffer
+
+
+def upload_image(server_url, image_path, resize=True):
     """
     Upload an image to the calendar server.
     
     Args:
         server_url: Base URL of the webhook server (e.g., http://192.168.1.100:8765)
         image_path: Local path to the image file
+        resize: Scale down pictures larger than the display needs before upload
     
     Returns:
         bool: True if successful, False otherwise
@@ -30,18 +155,31 @@ def upload_image(server_url, image_path):
     
     # Get filename
     filename = os.path.basename(image_path)
-    
+
+    # Reject what the server would reject, before sending anything
+    if os.path.splitext(filename)[1].lower() not in IMAGE_EXTENSIONS:
+        print(f"Error: File type not allowed: {filename} (use {', '.join(sorted(IMAGE_EXTENSIONS))})")
+        return False
+
     print(f"Uploading {filename} to {server_url}...")
+
+    try:
+        prepared = prepare_image(image_path, resize)
+    except ValueError as e:
+        print(f"✗ Error: {filename} is {e}")
+        return False
     
     try:
-        # Open file and upload
-        with open(image_path, 'rb') as f:
-            files = {'file': (filename, f, 'image/jpeg')}
+        # Stream the file (or the resized copy) as the request body
+        content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        with prepared or open(image_path, 'rb') as f:
+            body = MultipartFileBody('file', filename, f, content_type)
             
             # Make the POST request
-            response = requests.post(
+            response = _session.post(
                 f"{server_url}/upload",
-                files=files,
+                data=body,
+                headers={'Content-Type': body.content_type},
                 timeout=30
             )
         
@@ -72,6 +210,7 @@ def main():
 Examples:
   python upload_pic.py http://192.168.1.100:8765 photo.jpg
   python upload_pic.py http://raspberrypi.local:8765 /path/to/image.png
+  python upload_pic.py http://raspberrypi.local:8765 *.jpg
         """
     )
     
@@ -81,16 +220,24 @@ Examples:
     )
     
     parser.add_argument(
-        'image',
-        help='Path to image file to upload'
+        'images',
+        nargs='+',
+        metavar='image',
+        help='Path to image file(s) to upload'
+    )
+    
+    parser.add_argument(
+        '--original',
+        action='store_true',
+        help='Upload pictures unchanged instead of scaling large ones down'
     )
     
     args = parser.parse_args()
     
-    # Upload the image
-    success = upload_image(args.server, args.image)
+    # Upload the images over the shared connection
+    results = [upload_image(args.server, image, resize=not args.original) for image in args.images]
     
-    sys.exit(0 if success else 1)
+    sys.exit(0 if all(results) else 1)
 
 
 if __name__ == '__main__':
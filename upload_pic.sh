@@ -5,7 +5,7 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Check if arguments provided
 if [ $# -lt 2 ]; then
-    echo "Usage: ./upload_pic.sh <server_url> <image_path>"
+    echo "Usage: ./upload_pic.sh <server_url> <image_path> [<image_path> ...]"
     echo ""
     echo "Example:"
     echo "  ./upload_pic.sh http://192.168.1.100:8765 photo.jpg"
@@ -14,7 +14,7 @@ if [ $# -lt 2 ]; then
 fi
 
 SERVER_URL="$1"
-IMAGE_PATH="$2"
+shift
 
 # Check if virtual environment exists
 if [ -f "$SCRIPT_DIR/venv/bin/python3" ]; then
@@ -24,4 +24,4 @@ else
 fi
 
 # Run the upload script
-"$PYTHON" "$SCRIPT_DIR/upload_pic.py" "$SERVER_URL" "$IMAGE_PATH"
+"$PYTHON" "$SCRIPT_DIR/upload_pic.py" "$SERVER_URL" "$@"